@@ -0,0 +1,114 @@
+import ast
+import time
+import tracemalloc
+import types
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Benchmarks the multi-channel aggregation in app.py against synthetic OAuth bundles.
+# app.py is a Streamlit script (it renders on import), so the functions under test
+# are lifted out of its source instead of importing it.
+#
+#   python "Script: bench_aggregation.py"
+
+APP = Path(__file__).with_name("app.py")
+SIZES = [10, 100, 1_000]
+DAYS = 14
+COUNTRIES = 200
+
+def load_from_app(*names: str) -> dict:
+    """
+    Compile just the named top-level functions and constants from app.py (decorators
+    stripped), with this script's imported modules as their globals.
+    """
+    tree = ast.parse(APP.read_text(encoding="utf-8"))
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in names:
+            node.decorator_list = []
+            body.append(node)
+        elif isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) in names:
+            body.append(node)
+    ns = {k: v for k, v in globals().items() if isinstance(v, types.ModuleType)}
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(APP), "exec"), ns)
+    missing = [n for n in names if n not in ns]
+    if missing:
+        raise SystemExit(f"not found in app.py: {missing}")
+    return ns
+
+# ---- previous implementations (per-bundle merge / iterrows), for comparison ----
+def legacy_daily(frames):
+    total = pd.DataFrame(columns=["date", "views"])
+    for df in frames:
+        if df.empty:
+            continue
+        if total.empty:
+            total = df.copy()
+        else:
+            total = total.merge(df, on="date", how="outer", suffixes=("", "_x"))
+            view_cols = [c for c in total.columns if c.startswith("views")]
+            total["views"] = total[view_cols].fillna(0).sum(axis=1).astype(int)
+            total = total[["date", "views"]]
+    return total.sort_values("date")
+
+def legacy_countries(frames):
+    acc = defaultdict(int)
+    for df in frames:
+        for _, r in df.iterrows():
+            acc[str(r["country"])] += int(r["views"])
+    return pd.DataFrame({"country": list(acc.keys()), "views": list(acc.values())})
+
+# ---- synthetic bundles ----
+def synth(n_bundles: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=DAYS)
+    codes = [chr(65 + i // 26) + chr(65 + i % 26) for i in range(COUNTRIES)]
+    daily, countries = [], []
+    for _ in range(n_bundles):
+        # channels don't all report every day / country
+        keep = rng.random(DAYS) > 0.1
+        daily.append(pd.DataFrame({"date": dates[keep], "views": rng.integers(0, 50_000, keep.sum())}))
+        k = int(rng.integers(20, COUNTRIES))
+        countries.append(pd.DataFrame({"country": rng.choice(codes, k, replace=False),
+                                       "views": rng.integers(1, 10_000, k)}))
+    return daily, countries
+
+def measure(fn, frames, repeat: int = 3):
+    """Best-of-N wall time, then a separate traced run for peak memory (tracing skews timing)."""
+    secs = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(frames)
+        secs = min(secs, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(frames)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, secs, peak
+
+def main():
+    ns = load_from_app("_sum_by_key", "sum_daily_frames", "sum_country_frames")
+    cases = [
+        ("daily",     ns["sum_daily_frames"],   legacy_daily,     0),
+        ("countries", ns["sum_country_frames"], legacy_countries, 1),
+    ]
+    print(f"{'series':<10} {'bundles':>7} {'impl':<7} {'time ms':>10} {'peak MiB':>9}")
+    for n in SIZES:
+        data = synth(n)
+        for label, new, old, idx in cases:
+            frames = data[idx]
+            res = {}
+            for impl, fn in (("arrays", new), ("legacy", old)):
+                out, secs, peak = measure(fn, frames, repeat=3 if impl == "arrays" else 1)
+                res[impl] = out
+                print(f"{label:<10} {n:>7} {impl:<7} {secs * 1e3:>10.1f} {peak / 2**20:>9.2f}")
+            key = "date" if label == "daily" else "country"
+            a = res["arrays"].sort_values(key).reset_index(drop=True)
+            b = res["legacy"].sort_values(key).reset_index(drop=True)
+            assert a["views"].astype(int).tolist() == b["views"].astype(int).tolist(), f"{label}: results differ"
+
+if __name__ == "__main__":
+    main()
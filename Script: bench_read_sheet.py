@@ -0,0 +1,111 @@
+import ast
+import functools
+import re
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Benchmarks worksheet parsing (header detection, blank rows, header normalization)
+# in app.py against a synthetic filming log. Like bench_aggregation.py, the functions
+# are lifted out of app.py's source because importing it renders the page.
+#
+#   python "Script: bench_read_sheet.py"
+
+APP = Path(__file__).with_name("app.py")
+SIZES = [1_000, 10_000, 100_000]
+NAMES = ("HEADER_SCAN_ROWS", "HEADER_KEYWORDS", "_HDR_NONWORD", "norm_header", "_header_row", "sheet_frame")
+
+def load_from_app(*names: str) -> dict:
+    """
+    Compile just the named top-level functions and constants from app.py (decorators
+    stripped), with this script's imported modules as their globals.
+    """
+    tree = ast.parse(APP.read_text(encoding="utf-8"))
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in names:
+            node.decorator_list = []
+            body.append(node)
+        elif isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) in names:
+            body.append(node)
+    ns = {k: v for k, v in globals().items() if isinstance(v, types.ModuleType)}
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(APP), "exec"), ns)
+    missing = [n for n in names if n not in ns]
+    if missing:
+        raise SystemExit(f"not found in app.py: {missing}")
+    return ns
+
+# ---- previous implementation (Python loops, apply(axis=1)), for comparison ----
+def legacy_parse(rows):
+    if not rows:
+        return pd.DataFrame()
+    width = max(len(r) for r in rows)
+    rows = [list(r) + [""] * (width - len(r)) for r in rows]
+
+    def norm_hdr(v: str) -> str:
+        s = re.sub(r"[^\w]+", "_", (v or "").strip().lower())
+        return re.sub(r"^_+|_+$", "", s)
+
+    header_row_idx, best_score = None, -1
+    for i, r in enumerate(rows[:20]):
+        probes = [norm_hdr(x) for x in r]
+        score = sum(p in ("date", "time", "title", "event", "timeslot", "when") for p in probes)
+        score += 0.1 * sum(bool((x or "").strip()) for x in r)
+        if score > best_score:
+            best_score, header_row_idx = score, i
+    header_row_idx = header_row_idx or 0
+
+    df = pd.DataFrame(rows[header_row_idx + 1:], columns=rows[header_row_idx]).fillna("")
+    df = df.loc[:, ~(df.columns.astype(str).str.strip() == "")]
+
+    def _norm(s):
+        s = str(s or "").strip().lower()
+        s = re.sub(r"[^\w]+", "_", s)
+        return re.sub(r"^_+|_+$", "", s)
+    df.columns = [_norm(c) for c in df.columns]
+    if not df.empty:
+        df = df[~(df.apply(lambda r: all(str(x).strip() == "" for x in r), axis=1))]
+    return df.reset_index(drop=True)
+
+# ---- synthetic filming log: preface rows, ragged rows, ~10% blank rows ----
+def synth(n_rows: int, seed: int = 7) -> list[list[str]]:
+    rng = np.random.default_rng(seed)
+    rows = [["Filming log"], [], ["Date", "Time", "Title:", "", "Notes"]]
+    days = rng.integers(1, 29, n_rows)
+    months = rng.integers(1, 13, n_rows)
+    hours = rng.integers(7, 20, n_rows)
+    for i in range(n_rows):
+        r = rng.random()
+        if r < 0.1:
+            rows.append(["", " ", ""])
+        elif r < 0.2:
+            rows.append([f"{days[i]}/{months[i]}", "", f"Take {i}"])   # trimmed trailing cells
+        else:
+            rows.append([f"{days[i]}/{months[i]}/2025", f"{hours[i]:02d}:00", f"Take {i}", "", f"note {i}"])
+    return rows
+
+def best_of(fn, rows, repeat: int):
+    secs = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(rows)
+        secs = min(secs, time.perf_counter() - t0)
+    return out, secs
+
+def main():
+    ns = load_from_app(*NAMES)
+    print(f"{'rows':>8} {'impl':<10} {'time ms':>10}")
+    for n in SIZES:
+        rows = synth(n)
+        new, t_new = best_of(ns["sheet_frame"], rows, 3)
+        old, t_old = best_of(legacy_parse, rows, 1)
+        print(f"{n:>8} {'vectorized':<10} {t_new * 1e3:>10.1f}")
+        print(f"{n:>8} {'legacy':<10} {t_old * 1e3:>10.1f}   ({t_old / t_new:.1f}x)")
+        assert list(new.columns) == list(old.columns), "headers differ"
+        assert new.astype(str).equals(old.astype(str)), "rows differ"
+
+if __name__ == "__main__":
+    main()
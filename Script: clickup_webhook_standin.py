@@ -0,0 +1,59 @@
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import time
+import uuid
+
+import requests
+
+# Stand-in for ClickUp: posts signed task webhooks to the dashboard's receiver,
+# the same way ClickUp does (X-Signature = HMAC-SHA256 of the raw body, hex).
+# Start the app with CLICKUP_WEBHOOK_SECRET set, then e.g.:
+#
+#   python "Script: clickup_webhook_standin.py" --task-id 86abc123 --event taskUpdated
+#   python "Script: clickup_webhook_standin.py" --task-id 86abc123 --event taskDeleted
+#   python "Script: clickup_webhook_standin.py" --task-id 86abc123 --bad-signature   # expect 401
+
+EVENTS = ("taskCreated", "taskUpdated", "taskDeleted")
+
+def sample_payload(event: str, task_id: str) -> dict:
+    now_ms = str(int(time.time() * 1000))
+    history = {
+        "taskCreated": {"field": "status", "after": {"status": "to do", "type": "open"}},
+        "taskUpdated": {"field": "name", "before": "Old name", "after": "New name"},
+        "taskDeleted": {"field": "deleted"},
+    }[event]
+    return {
+        "event": event,
+        "task_id": task_id,
+        "webhook_id": "standin-" + uuid.uuid4().hex[:8],
+        "history_items": [{"id": uuid.uuid4().hex, "type": 1, "date": now_ms, "user": {"username": "standin"}, **history}],
+    }
+
+def post(url: str, secret: str, payload: dict, bad_signature: bool = False) -> requests.Response:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    sig = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    if bad_signature:
+        sig = sig[::-1]
+    return requests.post(url, data=body, timeout=5,
+                         headers={"Content-Type": "application/json", "X-Signature": sig})
+
+def main():
+    ap = argparse.ArgumentParser(description="Post signed ClickUp task webhooks to the dashboard.")
+    ap.add_argument("--url", default="http://localhost:8765/")
+    ap.add_argument("--secret", default=os.environ.get("CLICKUP_WEBHOOK_SECRET", ""))
+    ap.add_argument("--task-id", required=True)
+    ap.add_argument("--event", choices=EVENTS, default="taskUpdated")
+    ap.add_argument("--bad-signature", action="store_true", help="corrupt the signature (receiver should answer 401)")
+    args = ap.parse_args()
+    if not args.secret:
+        raise SystemExit("Set --secret or CLICKUP_WEBHOOK_SECRET (same value as the app's secret).")
+
+    payload = sample_payload(args.event, args.task_id)
+    r = post(args.url, args.secret, payload, bad_signature=args.bad_signature)
+    print(f"{args.event} {args.task_id} -> HTTP {r.status_code}")
+
+if __name__ == "__main__":
+    main()
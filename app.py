@@ -2,14 +2,32 @@ __LV_VERSION__ = "v3.1b-cards-alignedbars (sha:0523c1c9, refactor-01)"
 
 # app.py — LoudVoice Dashboard (cards + aligned bars layout)
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import re
 import pytz
 import json
+import copy
+import functools
+import html
+import pickle
+import hashlib
+import hmac
+import os
+import sqlite3
+from contextlib import closing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pandas as pd
 import plotly.graph_objects as go
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import jinja2
+from markupsafe import Markup
 import streamlit as st
+import streamlit.components.v1 as components
 
 from streamlit.runtime.scriptrunner import add_script_run_ctx
 from streamlit_autorefresh import st_autorefresh  # pip install streamlit-autorefresh
@@ -25,10 +43,14 @@ try:
     from google.oauth2.credentials import Credentials as UserCredentials
     from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
+    from google_auth_httplib2 import AuthorizedHttp
+    import httplib2
 except Exception:
     GOOGLE_OK = False
 import base64
 from pathlib import Path
+from glob import escape as glob_escape
 
 import gspread
 # Service Account for Google Sheets
@@ -60,6 +82,17 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="collapsed"
 )
+qp = st.query_params
+
+# ?live=1: the page is one client-side component fed JSON diffs (see "Live mode" below)
+LIVE = str(qp.get("live", "0")).lower() in ("1", "true", "yes")
+PAGE_STYLES: list[str] = []      # stylesheet blocks, replayed into the live component on a full sync
+
+def page_style(block: str) -> None:
+    """Emit a <style>/<link> block for the whole page (kept for the component in live mode)."""
+    PAGE_STYLES.append(block)
+    if not LIVE:
+        st.markdown(block, unsafe_allow_html=True)
 
 # Force dark background globally
 st.markdown("""
@@ -72,7 +105,7 @@ html, body, [class^="css"] {
 </style>
 """, unsafe_allow_html=True)
 
-st.markdown("""
+page_style("""
 <style>
 @import url('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css');
 
@@ -81,60 +114,62 @@ st.markdown("""
 .kpi-head{ display:flex; align-items:center; gap:8px; margin-bottom:4px; }
 .icon{ font-size:15px; }   /* add this so the FA glyph has a size */
 </style>
-""", unsafe_allow_html=True)
+""")
 
-st.markdown("""
+page_style("""
 <link rel="stylesheet"
       href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css"
       integrity="sha512-bx8wN/so2HnIY7+q3sU5o7bQ/ud9l1z4PCtRj2CFf7RYI0ehCyBN8DQ3lmgwPcj3doGht+jOZQf1BPZpbnRgfQ=="
       crossorigin="anonymous" referrerpolicy="no-referrer" />
-""", unsafe_allow_html=True)
+""")
 
-# Inject favicon + iOS Home Screen icon into <head>
-st.markdown(
-    """
-    <script>
-    (function () {
-      const head = document.getElementsByTagName('head')[0];
-
-      function upsert(rel, href, sizes) {
-        let sel = link[rel='${rel}'] + (sizes ? [sizes='${sizes}'] : '');
-        let el = document.querySelector(sel);
-        if (!el) {
-          el = document.createElement('link');
-          el.rel = rel;
-          if (sizes) el.sizes = sizes;
-          head.appendChild(el);
-        }
-        // cache-bust so iOS/ Safari stop using the old one
-        el.href = href + ?v=${Date.now()};
-      }
-
-      // Standard favicon for browsers
-      upsert('icon', 'assets/loudvoice_favicon.ico');
-
-      // iOS Home Screen icon (rounded automatically by iOS)
-      upsert('apple-touch-icon', 'assets/loudvoice_logo.png', '180x180');
-
-      // (Optional) pinned tab mask for Safari macOS if you have an SVG:
-      // upsert('mask-icon', 'assets/loudvoice_mask.svg');
-      // document.querySelector("link[rel='mask-icon']").setAttribute('color', '#ffd54a');
-    })();
-    </script>
-    """,
-    unsafe_allow_html=True,
-)
+# Inject favicon + iOS Home Screen icon into <head> (not needed inside the live component)
+if not LIVE:
+    st.markdown(
+        """
+        <script>
+        (function () {
+          const head = document.getElementsByTagName('head')[0];
+
+          function upsert(rel, href, sizes) {
+            let sel = link[rel='${rel}'] + (sizes ? [sizes='${sizes}'] : '');
+            let el = document.querySelector(sel);
+            if (!el) {
+              el = document.createElement('link');
+              el.rel = rel;
+              if (sizes) el.sizes = sizes;
+              head.appendChild(el);
+            }
+            // cache-bust so iOS/ Safari stop using the old one
+            el.href = href + ?v=${Date.now()};
+          }
+
+          // Standard favicon for browsers
+          upsert('icon', 'assets/loudvoice_favicon.ico');
+
+          // iOS Home Screen icon (rounded automatically by iOS)
+          upsert('apple-touch-icon', 'assets/loudvoice_logo.png', '180x180');
+
+          // (Optional) pinned tab mask for Safari macOS if you have an SVG:
+          // upsert('mask-icon', 'assets/loudvoice_mask.svg');
+          // document.querySelector("link[rel='mask-icon']").setAttribute('color', '#ffd54a');
+        })();
+        </script>
+        """,
+        unsafe_allow_html=True,
+    )
 st_autorefresh(interval=5 * 60 * 1000, key="auto_refresh")  # 5 minutes
-qp = st.query_params
 
 HIDE_CB = qp.get("legend", ["1"])[0].lower() in ("0","false","no")  # legend=0 hides colorbar
+MAP_MODE = str(qp.get("map", "plotly")).lower()   # ?map=svg: server-rendered map, no plotly.js
 MAP_H_QP = qp.get("map_h", [""])[0]
 MAP_H_QP = int(MAP_H_QP) if MAP_H_QP.isdigit() else None
 
 ZOOM = qp.get("zoom", ["80"])[0]   # default 80%; override with ?zoom=100 if needed
 COMPACT = qp.get("compact", ["0"])[0].lower() in ("1", "true", "yes")
 # QoL: force clear all Streamlit caches via ?clear_cache=1
-if qp.get("clear_cache", ["0"])[0] in ("1","true","yes"):
+CLEAR_CACHE = qp.get("clear_cache", ["0"])[0] in ("1","true","yes")
+if CLEAR_CACHE:
     st.cache_data.clear()
     st.toast("Cache cleared", icon="♻️")
 
@@ -144,7 +179,7 @@ DEBUG = qp.get("debug", ["0"])[0].lower() in ("1","true","yes")
 # -------------------------------
 # Styles
 # -------------------------------
-st.markdown("""
+page_style("""
 <style>
 @import url('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css');
 
@@ -320,6 +355,13 @@ section.main > div.block-container {
   word-break:break-word;
   text-align:left;
 }
+.chip {
+  font-size:11px;
+  background:rgba(255,255,255,.08);
+  padding:2px 6px;
+  border-radius:8px;
+  margin-left:6px;
+}
 
 /* ---- Responsive tweaks ---- */
 @media (max-width:1100px){
@@ -332,9 +374,9 @@ section.main > div.block-container {
   .grid-views{ grid-template-columns:48px 1fr 64px; }
 }
 </style>
-""", unsafe_allow_html=True)
+""")
 
-st.markdown("""
+page_style("""
 <style>
 /* === ALIGN ROW 1 (stats) AND ROW 2 (cards) === */
 
@@ -379,13 +421,24 @@ div[data-testid="stHorizontalBlock"] > div > .card {
     justify-content: center;
 }
 </style>
-""", unsafe_allow_html=True)
+""")
 
 # =======================
 # Helpers & Data calls
 # =======================
 
 DAYS_FOR_MAP = 28                # 28‑day country map window
+
+SCHED_MAX_STALENESS = 3600       # older snapshots make reruns wait for a refresh instead
+# Background refresh cadence per data source (seconds)
+REFRESH_EVERY = {
+    "yt_kpi":        300,
+    "yt_daily":      300,
+    "yt_countries":  300,
+    "clickup_tasks": 120,
+    "calendars":     120,
+    "sheets":         15,        # revision check only, values re-downloaded on change
+}
 # Default 600 desktop, tighter on phones; allow ?map_h=### to override
 MAP_HEIGHT = MAP_H_QP or (360 if COMPACT else 620)
 
@@ -398,13 +451,177 @@ def fmt_num(n: int) -> str:
     if n >= 1_000:         v = n / 1_000;         return (f"{v:.1f}".rstrip("0").rstrip(".")) + "K"
     return f"{n}"
 
-@st.cache_data(ttl=300)
-def http_get(url, params=None, headers=None):
-    r = requests.get(url, params=params, headers=headers, timeout=25)
+# ---- TTL cache for fetchers ----
+# Script runs never call fetchers: they read RefreshScheduler snapshots, which are the
+# one stale-while-revalidate layer. This cache only dedupes upstream calls across jobs.
+TTL_MAX_ENTRIES      = 256       # per fetcher
+_TTL_CACHES: list = []
+
+@st.cache_resource
+def ttl_state(name: str) -> dict:
+    """Per-fetcher cache state, shared by every script run and the scheduler threads."""
+    return {"entries": {}, "key_locks": {}, "lock": threading.Lock()}
+
+def ttl_cache(ttl: int):
+    """
+    Memoize a fetcher like st.cache_data(ttl=...), but thread-safe and single-flight:
+    concurrent callers of an expired key wait for ONE upstream call.
+    Values are deep-copied out, so callers may mutate what they get.
+    """
+    def deco(fn):
+        # Streamlit re-executes this module on every rerun; keeping the state in a
+        # cache_resource means ttl_clear_all() also drops what the scheduler is reading.
+        state = ttl_state(fn.__qualname__)
+        entries: dict = state["entries"]      # key -> (value, fetched_at)
+        key_locks: dict = state["key_locks"]  # key -> Lock (single-flight computes), dropped with the entry
+        lock = state["lock"]
+
+        def key_of(args, kwargs) -> str:
+            return hashlib.sha256(pickle.dumps((args, sorted(kwargs.items())))).hexdigest()
+
+        def compute(key, args, kwargs):
+            with lock:
+                klock = key_locks.setdefault(key, threading.Lock())
+            with klock:
+                hit = entries.get(key)
+                if hit and time.time() - hit[1] < ttl:
+                    return hit[0]
+                try:
+                    value = fn(*args, **kwargs)
+                except Exception:
+                    with lock:
+                        if key not in entries:
+                            key_locks.pop(key, None)   # don't keep locks for keys that never cached
+                    raise
+                with lock:
+                    entries[key] = (value, time.time())
+                    while len(entries) > TTL_MAX_ENTRIES:
+                        evicted = next(iter(entries))
+                        entries.pop(evicted)
+                        key_locks.pop(evicted, None)
+                return value
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_of(args, kwargs)
+            hit = entries.get(key)
+            if hit and time.time() - hit[1] < ttl:
+                return copy.deepcopy(hit[0])
+            return copy.deepcopy(compute(key, args, kwargs))
+
+        def clear() -> None:
+            with lock:
+                entries.clear()
+                key_locks.clear()
+
+        wrapper.clear = clear
+        _TTL_CACHES.append(wrapper)
+        return wrapper
+
+    return deco
+
+def ttl_clear_all() -> None:
+    for fn in _TTL_CACHES:
+        fn.clear()
+
+# ---- Shared HTTP transport (all REST calls) ----
+HTTP_TIMEOUT = (5, 20)           # (connect, read) seconds
+HTTP_RETRIES = 4                 # on connect errors, 429 and 5xx
+HTTP_BACKOFF = 0.5               # exponential: 0.5s, 1s, 2s… (+ jitter), Retry-After wins
+
+@st.cache_resource
+def http_session() -> requests.Session:
+    """
+    One pooled keep-alive session for every REST fetcher: a connection pool per host,
+    gzip, and retries with exponential backoff + jitter that honour Retry-After.
+    """
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        backoff_jitter=HTTP_BACKOFF,
+        backoff_max=30,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,   # hand the final response to raise_for_status()
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    sess = requests.Session()
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    sess.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": "loudvoice-tv"})
+    return sess
+
+def http_request(url, params=None, headers=None, timeout=HTTP_TIMEOUT) -> requests.Response:
+    """GET through the shared session; raises for non-2xx after retries."""
+    r = http_session().get(url, params=params, headers=headers, timeout=timeout)
     r.raise_for_status()
-    return r.json()
+    return r
+
+# ---- Conditional requests (ETag / If-None-Match) ----
+class ETagStore:
+    """
+    Last ETag + parsed body per request, so a 304 Not Modified reuses the parse.
+    Counts 304s vs full responses to show the bandwidth saved.
+    """
+
+    MAX_ENTRIES = 512
 
-@st.cache_data(ttl=300)
+    def __init__(self):
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.stats = {"full": 0, "not_modified": 0, "bytes_saved": 0}
+
+    def get(self, key: str) -> dict | None:
+        return self._entries.get(key)
+
+    def put(self, key: str, etag: str, body, size: int) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {"etag": etag, "body": body, "size": size}
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.pop(next(iter(self._entries)))
+
+    def count(self, not_modified: bool, size: int = 0) -> None:
+        with self._lock:
+            if not_modified:
+                self.stats["not_modified"] += 1
+                self.stats["bytes_saved"] += size
+            else:
+                self.stats["full"] += 1
+
+    def summary(self) -> str:
+        st_ = self.stats
+        total = st_["full"] + st_["not_modified"]
+        pct = (100 * st_["not_modified"] / total) if total else 0
+        return (f"{st_['not_modified']}/{total} not modified ({pct:.0f}%), "
+                f"{st_['bytes_saved'] / 1024:.1f} KiB saved")
+
+@st.cache_resource
+def etag_store() -> ETagStore:
+    return ETagStore()
+
+@ttl_cache(ttl=300)
+def http_get(url, params=None, headers=None):
+    """JSON GET that revalidates with If-None-Match when the API hands out ETags."""
+    store = etag_store()
+    key = hashlib.sha256(pickle.dumps((url, sorted((params or {}).items()), sorted((headers or {}).items())))).hexdigest()
+    cached = store.get(key)
+    hdrs = dict(headers or {})
+    if cached:
+        hdrs["If-None-Match"] = cached["etag"]
+    r = http_request(url, params=params, headers=hdrs)
+    if r.status_code == 304 and cached:
+        store.count(not_modified=True, size=cached["size"])
+        return cached["body"]
+    body = r.json()
+    store.count(not_modified=False)
+    etag = r.headers.get("ETag") or (body.get("etag") if isinstance(body, dict) else None)
+    if etag:
+        store.put(key, etag, body, len(r.content))
+    return body
+
+@ttl_cache(ttl=300)
 def yt_channel_stats(api_key: str, channel_id: str):
     """Simple KPI card numbers (subs + lifetime views)."""
     data = http_get(
@@ -417,118 +634,426 @@ def yt_channel_stats(api_key: str, channel_id: str):
     stats = items[0]["statistics"]
     return {"subs": int(stats.get("subscriberCount", 0)), "total": int(stats.get("viewCount", 0))}
     
+YT_IDS_PER_REQUEST = 50          # channels.list accepts up to 50 comma-separated ids
+
+@ttl_cache(ttl=300)
+def yt_channels_stats_batched(api_key: str, channel_ids: list[str]) -> dict:
+    """
+    Subs + lifetime views for many channels, one channels.list call per 50 ids.
+    Returns {"channels": {cid: {"subs", "total"}}, "missing": [cid, ...]}.
+    """
+    ids = list(dict.fromkeys(c.strip() for c in (channel_ids or []) if c and c.strip()))
+    per_channel = {}
+    for i in range(0, len(ids), YT_IDS_PER_REQUEST):
+        chunk = ids[i:i + YT_IDS_PER_REQUEST]
+        data = http_get(
+            "https://www.googleapis.com/youtube/v3/channels",
+            {"part": "statistics", "id": ",".join(chunk), "key": api_key, "maxResults": YT_IDS_PER_REQUEST},
+        )
+        for item in data.get("items", []) or []:
+            stats = item.get("statistics") or {}
+            per_channel[item["id"]] = {"subs": int(stats.get("subscriberCount", 0)),
+                                       "total": int(stats.get("viewCount", 0))}
+    missing = [c for c in ids if c not in per_channel]
+    return {"channels": per_channel, "missing": missing}
+
 # ---- Aggregation helpers ----
 def yt_channels_aggregate(api_key: str, channel_ids: list[str]) -> dict:
-    """Sum subs + lifetime views across multiple 'UC...' channels (Data API)."""
-    total_subs, total_views = 0, 0
-    for cid in (channel_ids or []):
+    """
+    Sum subs + lifetime views across multiple 'UC...' channels (Data API, batched).
+    Also returns the per-channel stats and any ids missing from the response.
+    """
+    res = yt_channels_stats_batched(api_key, list(channel_ids or []))
+    per_channel = res["channels"]
+    return {
+        "subs":  sum(v["subs"] for v in per_channel.values()),
+        "total": sum(v["total"] for v in per_channel.values()),
+        "channels": per_channel,
+        "missing": res["missing"],
+    }
+
+# ---- OAuth credential pool (one live access token per refresh-token bundle) ----
+YT_OAUTH_SCOPES = ["https://www.googleapis.com/auth/yt-analytics.readonly",
+                   "https://www.googleapis.com/auth/youtube.readonly"]
+TOKEN_REFRESH_MARGIN = 300       # refresh access tokens this many seconds before expiry
+TOKEN_SWEEP_EVERY    = 60        # background sweep cadence (seconds)
+
+class OAuthCredentialPool:
+    """
+    Shares one UserCredentials per bundle across every fetcher and thread.
+    Access tokens are reused until shortly before expiry and refreshed proactively
+    by a background sweep; a per-bundle lock makes concurrent refreshes single-flight.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+        self._sweeper = None
+
+    @staticmethod
+    def _expiring(creds, margin: int) -> bool:
+        if not creds.token or creds.expiry is None:
+            return True
+        return (creds.expiry - datetime.utcnow()).total_seconds() < margin
+
+    def _refresh(self, entry: dict, margin: int) -> None:
+        with entry["lock"]:
+            # Re-check under the lock: a concurrent caller may have just refreshed
+            if self._expiring(entry["creds"], margin):
+                entry["creds"].refresh(Request())
+
+    def get(self, client_id: str, client_secret: str, refresh_token: str):
+        key = (client_id, refresh_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                creds = UserCredentials(
+                    None,
+                    refresh_token=refresh_token,
+                    token_uri="https://oauth2.googleapis.com/token",
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    scopes=YT_OAUTH_SCOPES,
+                )
+                entry = self._entries[key] = {"creds": creds, "lock": threading.Lock()}
+            if self._sweeper is None or not self._sweeper.is_alive():
+                self._sweeper = threading.Thread(target=self._sweep, name="oauth-sweep", daemon=True)
+                self._sweeper.start()
+        self._refresh(entry, TOKEN_REFRESH_MARGIN)
+        return entry["creds"]
+
+    def _sweep(self) -> None:
+        while True:
+            time.sleep(TOKEN_SWEEP_EVERY)
+            for entry in list(self._entries.values()):
+                try:
+                    # Refresh early enough that no fetcher ever waits on the token endpoint
+                    self._refresh(entry, TOKEN_REFRESH_MARGIN + 2 * TOKEN_SWEEP_EVERY)
+                except Exception:
+                    pass  # the next get() retries and surfaces the error
+
+@st.cache_resource
+def oauth_pool() -> OAuthCredentialPool:
+    return OAuthCredentialPool()
+
+def oauth_credentials(client_id: str, client_secret: str, refresh_token: str):
+    """Valid (pooled) user credentials for one OAuth bundle."""
+    return oauth_pool().get(client_id, client_secret, refresh_token)
+
+# ---- Google API services (built once from the client library's discovery docs) ----
+@st.cache_resource
+def google_service(api: str, version: str):
+    """
+    Build an API surface once per process from the discovery document shipped with
+    google-api-python-client (static_discovery: no discovery fetch, even on cold start).
+    Credentials are bound per call via execute(http=oauth_http(creds)), so the
+    resource tree is never rebuilt.
+    """
+    # Placeholder transport: stops build looking for default credentials
+    return build(api, version, static_discovery=True, http=httplib2.Http())
+
+_OAUTH_HTTP = threading.local()
+
+def oauth_http(creds):
+    """Per-thread authorized transport for pooled credentials (httplib2 is not thread-safe)."""
+    cache = getattr(_OAUTH_HTTP, "by_creds", None)
+    if cache is None:
+        cache = _OAUTH_HTTP.by_creds = {}
+    http = cache.get(id(creds))
+    if http is None or http.credentials is not creds:
+        http = cache[id(creds)] = AuthorizedHttp(creds, http=httplib2.Http(timeout=25))
+    return http
+
+# ---- YouTube Analytics query engine ----
+ANALYTICS_DAY_COUNTRY = True     # one day×country report per bundle feeds both the 7-day bars and the map
+ANALYTICS_WINDOW      = max(14, DAYS_FOR_MAP)   # days fetched by the combined report
+
+def _analytics_window(days: int) -> tuple[str, str]:
+    """Inclusive [start, end] ending *yesterday* (local) — Studio only shows complete days."""
+    end_date = datetime.now(LOCAL_TZ).date() - timedelta(days=1)
+    start_date = end_date - timedelta(days=days - 1)
+    return start_date.isoformat(), end_date.isoformat()
+
+@ttl_cache(ttl=300)
+def yt_analytics_query(
+    client_id: str,
+    client_secret: str,
+    refresh_token: str,
+    metrics: str,
+    dimensions: str,
+    start_date: str,
+    end_date: str,
+    sort: str | None = None,
+    max_results: int | None = None,
+) -> pd.DataFrame:
+    """
+    The one place that runs reports().query for an OAuth bundle (channel==MINE).
+    Cached by (bundle, metrics, dimensions, window). Returns one column per dimension
+    then per metric; the 'day' dimension comes back as a naive 'date' column.
+    """
+    if not GOOGLE_OK:
+        raise RuntimeError("Google client libraries unavailable.")
+    creds = oauth_credentials(client_id, client_secret, refresh_token)
+    analytics = google_service("youtubeAnalytics", "v2")
+    params = dict(ids="channel==MINE", startDate=start_date, endDate=end_date,
+                  metrics=metrics, dimensions=dimensions)
+    if sort:
+        params["sort"] = sort
+    if max_results:
+        params["maxResults"] = max_results
+    resp = analytics.reports().query(**params).execute(http=oauth_http(creds))
+
+    dims = [d for d in dimensions.split(",") if d]
+    mets = [m for m in metrics.split(",") if m]
+    cols = ["date" if d == "day" else d for d in dims] + mets
+    df = pd.DataFrame(resp.get("rows", []) or [], columns=cols)
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"])
+    for m in mets:
+        df[m] = pd.to_numeric(df[m], errors="coerce").fillna(0).astype(int)
+    return df
+
+@st.cache_resource
+def day_country_rejected() -> set:
+    """Bundles whose day×country report the API refused; they use separate day / country queries."""
+    return set()
+
+def yt_analytics_day_country(client_id, client_secret, refresh_token, days: int = ANALYTICS_WINDOW) -> pd.DataFrame | None:
+    """
+    Combined report for ONE bundle -> DataFrame[date, country, views].
+    None if the API rejects the day×country combination (400) for this channel;
+    callers then fall back to separate day and country queries.
+    """
+    rejected = day_country_rejected()
+    if (client_id, refresh_token) in rejected:
+        return None
+    start, end = _analytics_window(days)
+    try:
+        return yt_analytics_query(client_id, client_secret, refresh_token,
+                                  "views", "day,country", start, end, sort="day")
+    except HttpError as e:
+        if e.resp.status != 400:
+            raise   # quota, auth, outages: real errors
+        rejected.add((client_id, refresh_token))
+        return None
+
+def daily_from_day_country(dc: pd.DataFrame, days: int) -> pd.DataFrame:
+    """Derive DataFrame[date, views] for the last N days from a day×country report."""
+    if dc.empty:
+        return pd.DataFrame(columns=["date", "views"])
+    start, _ = _analytics_window(days)
+    dc = dc[dc["date"] >= pd.Timestamp(start)]
+    return dc.groupby("date", as_index=False)["views"].sum().sort_values("date")
+
+def countries_from_day_country(dc: pd.DataFrame, days: int) -> pd.DataFrame:
+    """Derive DataFrame[country, views] over the last N days from a day×country report."""
+    if dc.empty:
+        return pd.DataFrame(columns=["country", "views"])
+    start, _ = _analytics_window(days)
+    dc = dc[dc["date"] >= pd.Timestamp(start)]
+    return (dc.groupby("country", as_index=False)["views"].sum()
+              .sort_values("views", ascending=False).reset_index(drop=True))
+
+# ---- Incremental daily-views store (SQLite) ----
+DATA_DIR = Path(os.environ.get("LV_DATA_DIR", ".lv_data"))   # local state that survives reruns/restarts
+DAILY_DB = DATA_DIR / "daily_views.sqlite"
+DAILY_RECHECK_DAYS  = 3          # Analytics lags up to 48h: the newest days are re-fetched every sync
+DAILY_BACKFILL_DAYS = 90         # history pulled on a channel's first sync
+_DAILY_DB_LOCK = threading.Lock()
+
+def _bundle_key(client_id: str, refresh_token: str) -> str:
+    """Stable per-channel key that doesn't put the refresh token on disk."""
+    return hashlib.sha256(f"{client_id}:{refresh_token}".encode()).hexdigest()[:16]
+
+def _daily_db() -> sqlite3.Connection:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(DAILY_DB, timeout=10)
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS daily_views ("
+        " channel TEXT NOT NULL, date TEXT NOT NULL, views INTEGER NOT NULL, synced_at REAL NOT NULL,"
+        " PRIMARY KEY (channel, date))"
+    )
+    return con
+
+def sync_daily_store(client_id: str, client_secret: str, refresh_token: str) -> str | None:
+    """
+    Bring ONE channel's stored daily views up to yesterday. Only days after the last
+    stored date (plus the DAILY_RECHECK_DAYS processing-lag window) are queried.
+    Returns the channel key used in the store, or None if the store is unavailable
+    (read-only / ephemeral disk, DATA_DIR not creatable). Analytics errors propagate.
+    """
+    key = _bundle_key(client_id, refresh_token)
+    _, end = _analytics_window(1)
+    yesterday = date.fromisoformat(end)
+    try:
+        with _DAILY_DB_LOCK, closing(_daily_db()) as con:
+            last = con.execute("SELECT MAX(date) FROM daily_views WHERE channel = ?", (key,)).fetchone()[0]
+    except (sqlite3.Error, OSError):
+        return None
+
+    recheck_from = yesterday - timedelta(days=DAILY_RECHECK_DAYS - 1)
+    if last:
+        start = min(date.fromisoformat(last) + timedelta(days=1), recheck_from)
+    else:
+        start = yesterday - timedelta(days=DAILY_BACKFILL_DAYS - 1)
+
+    dc = None
+    if ANALYTICS_DAY_COUNTRY and start >= yesterday - timedelta(days=ANALYTICS_WINDOW - 1):
+        # The map's day×country report already covers these days — no extra call
+        dc = yt_analytics_day_country(client_id, client_secret, refresh_token)
+    if dc is not None:
+        df = daily_from_day_country(dc, ANALYTICS_WINDOW)
+        df = df[df["date"] >= pd.Timestamp(start)]
+    else:
+        df = yt_analytics_query(client_id, client_secret, refresh_token, "views", "day",
+                                start.isoformat(), end, sort="day")
+
+    if not df.empty:
+        now = time.time()
+        rows = [(key, d.strftime("%Y-%m-%d"), int(v), now) for d, v in zip(df["date"], df["views"])]
         try:
-            stats = yt_channel_stats(api_key, cid)
-            total_subs += stats["subs"]
-            total_views += stats["total"]
-        except Exception as e:
-            st.warning(f"Error fetching channel {cid}: {e}")
-    return {"subs": total_subs, "total": total_views}
+            with _DAILY_DB_LOCK, closing(_daily_db()) as con, con:
+                con.executemany("INSERT OR REPLACE INTO daily_views VALUES (?, ?, ?, ?)", rows)
+        except (sqlite3.Error, OSError):
+            return None
+    return key
+
+def daily_from_store(channel_keys: list[str], days: int) -> pd.DataFrame:
+    """Summed DataFrame[date, views] for the last N complete days of the given channels."""
+    start, end = _analytics_window(days)
+    marks = ",".join("?" * len(channel_keys))
+    with closing(_daily_db()) as con:
+        df = pd.read_sql_query(
+            f"SELECT date, SUM(views) AS views FROM daily_views"
+            f" WHERE channel IN ({marks}) AND date BETWEEN ? AND ? GROUP BY date ORDER BY date",
+            con, params=[*channel_keys, start, end],
+        )
+    df["date"] = pd.to_datetime(df["date"])
+    df["views"] = df["views"].astype(int)
+    return df
 
 def _analytics_daily_for_refresh_token(client_id, client_secret, refresh_token, days=14) -> pd.DataFrame:
     """Daily views for ONE channel by OAuth bundle -> DataFrame[date, views]."""
     if not GOOGLE_OK:
         return pd.DataFrame()
-    creds = UserCredentials(
-        None,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=client_id,
-        client_secret=client_secret,
-        scopes=["https://www.googleapis.com/auth/yt-analytics.readonly",
-                "https://www.googleapis.com/auth/youtube.readonly"],
-    )
-    if not creds.valid:
-        creds.refresh(Request())
-    analytics = build("youtubeAnalytics", "v2", credentials=creds, cache_discovery=False)
-    end_date = (datetime.now(LOCAL_TZ).date() - timedelta(days=1))
-    start_date = end_date - timedelta(days=days - 1)
-    resp = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date.isoformat(),
-        endDate=end_date.isoformat(),
-        metrics="views",
-        dimensions="day",
-        sort="day",
-    ).execute()
-    rows = resp.get("rows", []) or []
-    df = pd.DataFrame(rows, columns=["date", "views"])
-    if not df.empty:
-        df["date"] = pd.to_datetime(df["date"], utc=True).dt.tz_convert(LOCAL_TZ).dt.normalize()
-        df["views"] = df["views"].astype(int)
-    return df
+    key = sync_daily_store(client_id, client_secret, refresh_token)
+    if key is not None:
+        try:
+            return daily_from_store([key], days)
+        except (sqlite3.Error, OSError):
+            pass  # store unreadable — query Analytics directly
+    if ANALYTICS_DAY_COUNTRY and days <= ANALYTICS_WINDOW:
+        dc = yt_analytics_day_country(client_id, client_secret, refresh_token)
+        if dc is not None:
+            return daily_from_day_country(dc, days)
+    start, end = _analytics_window(days)
+    return yt_analytics_query(client_id, client_secret, refresh_token, "views", "day", start, end, sort="day")
 
 def _analytics_countries_for_refresh_token(client_id, client_secret, refresh_token, days=28) -> pd.DataFrame:
     """28-day country views for ONE channel -> DataFrame[country, views]."""
     if not GOOGLE_OK:
         return pd.DataFrame()
-    creds = UserCredentials(
-        None,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=client_id,
-        client_secret=client_secret,
-        scopes=["https://www.googleapis.com/auth/yt-analytics.readonly",
-                "https://www.googleapis.com/auth/youtube.readonly"],
-    )
-    if not creds.valid:
-        creds.refresh(Request())
-    analytics = build("youtubeAnalytics", "v2", credentials=creds, cache_discovery=False)
-    end_date = (datetime.now(LOCAL_TZ).date() - timedelta(days=1))
-    start_date = end_date - timedelta(days=days - 1)
-    resp = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date.isoformat(),
-        endDate=end_date.isoformat(),
-        metrics="views",
-        dimensions="country",
-        sort="-views",
-        maxResults=200,
-    ).execute()
-    rows = resp.get("rows", []) or []
-    df = pd.DataFrame(rows, columns=["country", "views"])
-    if not df.empty:
-        df["views"] = df["views"].astype(int)
-    return df
-
-def aggregate_daily_from_oauth_bundles(bundles: list[dict], days=14) -> pd.DataFrame:
-    """Sum daily views across many OAuth bundles -> DataFrame[date, views]."""
-    total = pd.DataFrame(columns=["date", "views"])
-    for b in bundles or []:
-        df = _analytics_daily_for_refresh_token(b["client_id"], b["client_secret"], b["refresh_token"], days=days)
-        if df.empty: 
-            continue
-        if total.empty:
-            total = df.copy()
-        else:
-            total = total.merge(df, on="date", how="outer", suffixes=("", "_x"))
-            # sum across any 'views' columns
-            view_cols = [c for c in total.columns if c.startswith("views")]
-            total["views"] = total[view_cols].fillna(0).sum(axis=1).astype(int)
-            total = total[["date", "views"]]
-    total = total.sort_values("date")
-    return total
-
-def aggregate_countries_from_oauth_bundles(bundles: list[dict], days=28) -> pd.DataFrame:
-    """Sum country views across many OAuth bundles -> DataFrame[country, views]."""
-    from collections import defaultdict
-    acc = defaultdict(int)
-    for b in bundles or []:
-        df = _analytics_countries_for_refresh_token(b["client_id"], b["client_secret"], b["refresh_token"], days=days)
-        for _, r in df.iterrows():
-            acc[str(r["country"])] += int(r["views"])
-    if not acc:
-        return pd.DataFrame()
-    out = pd.DataFrame({"country": list(acc.keys()), "views": list(acc.values())})
+    if ANALYTICS_DAY_COUNTRY and days <= ANALYTICS_WINDOW:
+        dc = yt_analytics_day_country(client_id, client_secret, refresh_token)
+        if dc is not None:
+            return countries_from_day_country(dc, days)
+    start, end = _analytics_window(days)
+    return yt_analytics_query(client_id, client_secret, refresh_token, "views", "country", start, end,
+                              sort="-views", max_results=200)
+
+# ---- Multi-bundle fan-out ----
+BUNDLE_WORKERS = 8               # concurrent bundles (1 = sequential)
+BUNDLE_TIMEOUT = 20              # seconds the whole fan-out waits, queued bundles included
+
+def _bundle_label(b: dict, i: int) -> str:
+    return b.get("name") or b.get("label") or f"channel {i + 1}"
+
+def fan_out_oauth_bundles(bundles: list[dict], fn, **kwargs) -> tuple[list, list[dict]]:
+    """
+    Run fn(client_id, client_secret, refresh_token, **kwargs) for every bundle at once.
+    The fan-out as a whole gets one BUNDLE_TIMEOUT deadline (bundles queued behind hung
+    workers don't extend it); slow or failing bundles are dropped instead of sinking
+    the whole card.
+    Returns ([result of each successful bundle], [{"bundle", "ok", "error"} per bundle]).
+    """
+    bundles = list(bundles or [])
+    if not bundles:
+        return [], []
+
+    def run(b):
+        return fn(b["client_id"], b["client_secret"], b["refresh_token"], **kwargs)
+
+    status = [{"bundle": _bundle_label(b, i), "ok": False, "error": ""} for i, b in enumerate(bundles)]
+    results = {}
+    deadline = time.monotonic() + BUNDLE_TIMEOUT
+    ex = ThreadPoolExecutor(max_workers=max(1, min(BUNDLE_WORKERS, len(bundles))), thread_name_prefix="bundle")
+    futures = {ex.submit(run, b): i for i, b in enumerate(bundles)}
+    pending = set(futures)
+    try:
+        while pending:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                for f in pending:
+                    status[futures[f]]["error"] = f"timed out after {BUNDLE_TIMEOUT}s"
+                break
+            done, pending = wait(pending, timeout=left, return_when=FIRST_COMPLETED)
+            for f in done:
+                i = futures[f]
+                try:
+                    results[i] = f.result()
+                    status[i]["ok"] = True
+                except Exception as e:
+                    status[i]["error"] = str(e)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+    return [results[i] for i in sorted(results)], status
+
+def bundle_status_summary(status: list[dict]) -> str:
+    """'12/13 channels' style summary for card headers."""
+    return f"{sum(s['ok'] for s in status)}/{len(status)} channels" if status else ""
+
+def _sum_by_key(frames: list[pd.DataFrame], key: str, sort: bool, as_str: bool = False) -> pd.DataFrame:
+    """
+    Array-backed accumulator: concatenate the raw key/views columns of every frame once,
+    factorize the keys and bincount the views — linear in total rows, no per-bundle merges.
+    """
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=[key, "views"])
+    keys = np.concatenate([f[key].to_numpy() for f in frames])
+    if as_str:
+        keys = pd.Series(keys, copy=False).astype(str).to_numpy()
+    views = np.concatenate([f["views"].to_numpy(dtype=np.int64) for f in frames])
+    codes, uniq = pd.factorize(keys, sort=sort)
+    sums = np.bincount(codes, weights=views, minlength=len(uniq)).astype(np.int64)
+    return pd.DataFrame({key: uniq, "views": sums})
+
+def sum_daily_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Combine per-bundle DataFrame[date, views] into one DataFrame[date, views] sorted by date."""
+    out = _sum_by_key(frames, "date", sort=True)
+    out["date"] = pd.to_datetime(out["date"])
     return out
 
+def sum_country_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Combine per-bundle DataFrame[country, views] into one DataFrame[country, views]."""
+    out = _sum_by_key(frames, "country", sort=False, as_str=True)
+    return out if not out.empty else pd.DataFrame()
+
+def aggregate_daily_from_oauth_bundles(bundles: list[dict], days=14) -> tuple[pd.DataFrame, list[dict]]:
+    """Sum daily views across many OAuth bundles -> (DataFrame[date, views], per-bundle status)."""
+    frames, status = fan_out_oauth_bundles(bundles, _analytics_daily_for_refresh_token, days=days)
+    if status and not any(s["ok"] for s in status):
+        raise RuntimeError("; ".join(f"{s['bundle']}: {s['error']}" for s in status))
+    return sum_daily_frames(frames), status
+
+def aggregate_countries_from_oauth_bundles(bundles: list[dict], days=28) -> tuple[pd.DataFrame, list[dict]]:
+    """Sum country views across many OAuth bundles -> (DataFrame[country, views], per-bundle status)."""
+    frames, status = fan_out_oauth_bundles(bundles, _analytics_countries_for_refresh_token, days=days)
+    if status and not any(s["ok"] for s in status):
+        raise RuntimeError("; ".join(f"{s['bundle']}: {s['error']}" for s in status))
+    return sum_country_frames(frames), status
+
 # ---- YouTube Analytics: country views (last N days) ----
-@st.cache_data(ttl=300)
 def yt_analytics_country_lastN(
     client_id: str,
     client_secret: str,
@@ -539,120 +1064,114 @@ def yt_analytics_country_lastN(
     """
     Returns a DataFrame with columns: ['country', 'views'] for the last N days.
     Uses *yesterday* as end date to match Studio’s published windows.
+    (channel_id is ignored: the OAuth-authorized channel is always used.)
     """
     if not GOOGLE_OK:
         raise RuntimeError("Google client libraries unavailable.")
+    return _analytics_countries_for_refresh_token(client_id, client_secret, refresh_token, days=days)
 
-    # YouTube OAuth places (all three helpers where you create creds):
-    creds = UserCredentials(
-    None,
-    refresh_token=refresh_token,
-    token_uri="https://oauth2.googleapis.com/token",
-    client_id=client_id,
-    client_secret=client_secret,
-    scopes=["https://www.googleapis.com/auth/yt-analytics.readonly",
-            "https://www.googleapis.com/auth/youtube.readonly"],
-    )
-    if not creds.valid:
-        creds.refresh(Request())
-
-    analytics = build("youtubeAnalytics", "v2", credentials=creds, cache_discovery=False)
-
-    end_date = (datetime.now(LOCAL_TZ).date() - timedelta(days=1))          # yesterday
-    start_date = end_date - timedelta(days=days - 1)                   # inclusive window
-    #ids_val = f"channel=={channel_id}" if channel_id else "channel==MINE"
-    ids_val = "channel==MINE"  # ← force OAuth-authorized channel
-
-    resp = analytics.reports().query(
-        ids=ids_val,
-        startDate=start_date.isoformat(),
-        endDate=end_date.isoformat(),
-        metrics="views",
-        dimensions="country",
-        sort="-views",
-        maxResults=200,
-    ).execute()
-
-    rows = resp.get("rows", []) or []
-    df = pd.DataFrame(rows, columns=["country", "views"])
-    if not df.empty:
-        df["views"] = df["views"].astype(int)
-    return df
-
-@st.cache_data(ttl=300)
 def yt_analytics_lastN_and_countries(client_id, client_secret, refresh_token, days: int = 28):
     """
     YouTube Analytics: daily views (last N) + country views (last N).
     Uses yesterday as end date to avoid partial-day lag.
-    Returns: daily_df[date, views], cdf[country, views]
+    Returns: daily_df[date, views], cdf[country, views], error
     """
     if not GOOGLE_OK:
         return pd.DataFrame(), pd.DataFrame(), "Google client libraries unavailable."
-
     try:
-        creds = UserCredentials(
-            None,
-            refresh_token=refresh_token,
-            token_uri="https://oauth2.googleapis.com/token",
-            client_id=client_id,
-            client_secret=client_secret,
-            scopes=["https://www.googleapis.com/auth/yt-analytics.readonly",
-                    "https://www.googleapis.com/auth/youtube.readonly"],
-        )
-        if not creds.valid:
-            creds.refresh(Request())
-
-        analytics = build("youtubeAnalytics", "v2", credentials=creds, cache_discovery=False)
-
-        end_date = (datetime.now(LOCAL_TZ).date() - timedelta(days=1))  # yesterday
-        start_date = end_date - timedelta(days=days - 1)
-
-        # Daily views (channel timezone is not directly controllable; we normalize below)
-        daily = analytics.reports().query(
-            ids="channel==MINE",
-            startDate=start_date.isoformat(),
-            endDate=end_date.isoformat(),
-            metrics="views",
-            dimensions="day",
-            sort="day",
-        ).execute()
-        daily_rows = daily.get("rows", []) or []
-        daily_df = pd.DataFrame(daily_rows, columns=["date", "views"])
-        if not daily_df.empty:
-            daily_df["date"] = pd.to_datetime(daily_df["date"])
-            daily_df["views"] = daily_df["views"].astype(int)
-
-        # Country views (ISO‑2)
-        country = analytics.reports().query(
-            ids="channel==MINE",
-            startDate=start_date.isoformat(),
-            endDate=end_date.isoformat(),
-            metrics="views",
-            dimensions="country",
-            sort="-views",
-            maxResults=200,
-        ).execute()
-        cdf = pd.DataFrame(country.get("rows", []) or [], columns=["country", "views"])
-        if not cdf.empty:
-            cdf["views"] = cdf["views"].astype(int)
-
+        daily_df = _analytics_daily_for_refresh_token(client_id, client_secret, refresh_token, days=days)
+        cdf = _analytics_countries_for_refresh_token(client_id, client_secret, refresh_token, days=days)
         return daily_df, cdf, ""
     except Exception as e:
         return pd.DataFrame(), pd.DataFrame(), str(e)
 
-@st.cache_data
-def add_country_names(df: pd.DataFrame) -> pd.DataFrame:
+# ---- Country dimension (ISO2 / ISO3 / name / aliases) ----
+# Names YouTube, Studio exports and people use that pycountry doesn't know verbatim
+COUNTRY_ALIASES = {
+    "United States": "USA", "United Kingdom": "GBR",
+    "South Korea": "KOR", "North Korea": "PRK",
+    "Myanmar (Burma)": "MMR", "Taiwan": "TWN", "Hong Kong": "HKG",
+    "United Arab Emirates": "ARE", "Vietnam": "VNM", "Laos": "LAO", "Brunei": "BRN",
+    "Czechia": "CZE", "Slovakia": "SVK", "Russia": "RUS", "Moldova": "MDA",
+    "Macedonia": "MKD", "North Macedonia": "MKD", "Kosovo": "XKX",
+    "Ivory Coast": "CIV", "Côte d’Ivoire": "CIV",
+    "Iran": "IRN", "Syria": "SYR", "Palestine": "PSE",
+    "Tanzania": "TZA", "DR Congo": "COD", "Republic of the Congo": "COG",
+    "Eswatini": "SWZ", "Cabo Verde": "CPV",
+    "Bolivia": "BOL", "Venezuela": "VEN",
+    "Micronesia": "FSM", "Papua New Guinea": "PNG",
+}
+# Codes in use that aren't ISO 3166-1 (iso2, iso3, name)
+EXTRA_COUNTRIES = [("XK", "XKX", "Kosovo")]
+
+@st.cache_resource
+def country_dim() -> dict[str, pd.DataFrame]:
+    """
+    Built once per process from pycountry:
+      "countries": one row per country (iso2, iso3, name) — the map's world list
+      "keys":      Index of casefolded codes/names/aliases (first source wins: ISO codes
+                   and pycountry names, then COUNTRY_ALIASES) …
+      "rows":      … and the countries row each key points at
+      "cols":      countries columns as arrays with a trailing None (row -1 = unknown)
+    """
+    rows, keys = [], []
+    for c in pycountry.countries:
+        rows.append((c.alpha_2, c.alpha_3, c.name))
+        keys += [(v, c.alpha_3) for v in (c.alpha_2, c.alpha_3, c.name,
+                                           getattr(c, "official_name", None), getattr(c, "common_name", None)) if v]
+    for iso2, iso3, name in EXTRA_COUNTRIES:
+        rows.append((iso2, iso3, name))
+        keys += [(iso2, iso3), (iso3, iso3), (name, iso3)]
+    keys += list(COUNTRY_ALIASES.items())
+
+    countries = pd.DataFrame(rows, columns=["iso2", "iso3", "name"]).drop_duplicates("iso3").reset_index(drop=True)
+    aliases = pd.DataFrame(keys, columns=["key", "iso3"])
+    aliases["key"] = aliases["key"].str.strip().str.casefold()
+    aliases = aliases.drop_duplicates("key")
+    row_of = pd.Series(np.arange(len(countries)), index=countries["iso3"])
+    return {
+        "countries": countries,
+        "keys": pd.Index(aliases["key"]),
+        "rows": row_of.reindex(aliases["iso3"]).to_numpy(),
+        "cols": {c: np.append(countries[c].to_numpy(object), None) for c in ("iso2", "iso3", "name")},
+    }
+
+def join_countries(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """
+    Left-join the country dimension onto df[col] (ISO2, ISO3 or any known name/alias,
+    case-insensitive): adds iso2 / iso3 / name (None where unknown). One hash probe
+    for the whole column, then array takes — no per-row lookups.
+    """
+    dim = country_dim()
+    pos = dim["keys"].get_indexer(df[col].astype(str).str.strip().str.casefold())
+    rows = np.where(pos >= 0, dim["rows"][pos], -1)
     out = df.copy()
-    def to_name(code: str):
-        try:
-            rec = pycountry.countries.get(alpha_2=code)
-            return rec.name if rec else code
-        except Exception:
-            return code
-    if "country" in out.columns:
-        out["name"] = out["country"].apply(to_name)
+    for c, values in dim["cols"].items():
+        out[c] = values[rows]
     return out
 
+def add_country_names(df: pd.DataFrame) -> pd.DataFrame:
+    """ISO2 'country' column -> adds display 'name' (the code itself if unknown)."""
+    if "country" not in df.columns:
+        return df.copy()
+    out = join_countries(df, "country").drop(columns=["iso2", "iso3"])
+    out["name"] = out["name"].fillna(out["country"])
+    return out
+
+def country_to_iso3(name: str) -> str | None:
+    """Convert a country code / name to ISO-3 for Plotly choropleth (None if unknown)."""
+    return join_countries(pd.DataFrame({"country": [name]}), "country")["iso3"].iat[0]
+
+name_to_iso3 = country_to_iso3
+
+def choro_frame(cdf: pd.DataFrame) -> pd.DataFrame:
+    """Analytics rows (country, views) -> map rows with iso3 + display name; unknown codes dropped."""
+    if cdf.empty:
+        return pd.DataFrame(columns=["country", "views", "iso2", "iso3", "name"])
+    out = join_countries(cdf, "country")
+    out["name"] = out["name"].fillna(out["country"])
+    return out.dropna(subset=["iso3"]).reset_index(drop=True)
+
 def _adaptive_ticks(z_raw_max: int):
     """
     Build log-scale ticks from real counts:
@@ -686,6 +1205,10 @@ def _adaptive_ticks(z_raw_max: int):
     ticktext = [human(v) for v in vals]
     return tickvals, ticktext
 
+# Colour stops over log10(views + 1), shared by the Plotly and SVG maps
+MAP_LAT_RANGE  = (-55, 82)   # latitude crop (drops Antarctica)
+MAP_COLORSCALE = [[0.00, "#0b0f16"], [0.20, "#ffe600"], [0.40, "#ff3b3b"], [0.70, "#4285f4"], [1.00, "#34a853"]]
+
 def build_choropleth(choro_df: pd.DataFrame, height: int) -> go.Figure:
     import numpy as np
     z_raw = choro_df["views"].astype(int).clip(lower=0)
@@ -701,7 +1224,7 @@ def build_choropleth(choro_df: pd.DataFrame, height: int) -> go.Figure:
         locations=choro_df["iso3"], z=z,
         customdata=np.stack([choro_df["name"], z_raw], axis=1),
         hovertemplate="<b>%{customdata[0]}</b><br>Views: %{customdata[1]:,}<extra></extra>",
-        colorscale=[[0.00, "#0b0f16"], [0.20, "#ffe600"], [0.40, "#ff3b3b"], [0.70, "#4285f4"], [1.00, "#34a853"]],
+        colorscale=MAP_COLORSCALE,
         marker_line_color="rgba(255,255,255,.08)", marker_line_width=0.5,
         showscale=not HIDE_CB,
         colorbar=dict(
@@ -719,7 +1242,7 @@ def build_choropleth(choro_df: pd.DataFrame, height: int) -> go.Figure:
             # IMPORTANT: remove auto-fit so the scale sticks
             # (fitbounds="locations"),  # ← delete this line
             # Crop some ocean/poles for a fuller look on mobile:
-            lataxis=dict(range=[-55, 82]),
+            lataxis=dict(range=list(MAP_LAT_RANGE)),
             bgcolor="rgba(0,0,0,0)",
             showocean=True, oceancolor="#070a0f",
             showland=True, landcolor="#0b0f16",
@@ -732,33 +1255,111 @@ def build_choropleth(choro_df: pd.DataFrame, height: int) -> go.Figure:
     )
     return fig
 
-def country_to_iso3(name: str) -> str:
-    """Convert country name to ISO-3 code for Plotly choropleth."""
-    try:
-        return pycountry.countries.lookup(name).alpha_3
-    except LookupError:
-        overrides = {
-            "United States": "USA",
-            "South Korea": "KOR",
-            "North Korea": "PRK",
-            "Russia": "RUS",
-            "Iran": "IRN",
-            "Vietnam": "VNM",
-            "Taiwan": "TWN",
-            "Bolivia": "BOL",
-            "Venezuela": "VEN",
-            "Tanzania": "TZA",
-            "Syria": "SYR",
-            "Laos": "LAO",
-            "Brunei": "BRN",
-            "Czechia": "CZE",
-            "Slovakia": "SVK",
-            "Macedonia": "MKD",
-            "Moldova": "MDA",
-            "Palestine": "PSE",
-            "Kosovo": "XKX",
-        }
-        return overrides.get(name, None)
+# ---- Built figures, content-addressed ----
+FIG_CACHE_MAX = 16               # figures kept (distinct data × height × layout flags)
+
+@st.cache_resource
+def figure_cache() -> dict:
+    return {"lock": threading.Lock(), "items": {}}
+
+def frame_digest(df: pd.DataFrame, cols: list[str], *extra) -> str:
+    """Content hash of some columns of a frame (+ any extra params that shape the output)."""
+    h = hashlib.sha256(pd.util.hash_pandas_object(df[cols], index=False).to_numpy().tobytes())
+    h.update(repr(extra).encode())
+    return h.hexdigest()
+
+def cached_choropleth(choro_df: pd.DataFrame, height: int) -> go.Figure:
+    """
+    The map figure, built once per distinct content: keyed by the country views plus
+    height / HIDE_CB / COMPACT, so autorefreshes with unchanged data skip building it.
+    st.plotly_chart still serializes it on every rerun (it takes no pre-built spec).
+    The figure is shared between sessions — don't mutate it.
+    """
+    key = frame_digest(choro_df, ["iso3", "name", "views"], height, HIDE_CB, COMPACT)
+    return _figure_memo(key, lambda: build_choropleth(choro_df, height))
+
+def _figure_memo(key: str, build):
+    """LRU lookup in figure_cache(); build() on a miss."""
+    cache = figure_cache()
+    with cache["lock"]:
+        hit = cache["items"].pop(key, None)
+        if hit is not None:
+            cache["items"][key] = hit   # most recently used last
+            return hit
+    hit = build()
+    with cache["lock"]:
+        cache["items"][key] = hit
+        while len(cache["items"]) > FIG_CACHE_MAX:
+            cache["items"].pop(next(iter(cache["items"])))
+    return hit
+
+# ---- Lightweight SVG map (?map=svg): no JS charting runtime on the TV ----
+COUNTRY_CENTROIDS = Path("assets/country_centroids.json")   # ISO3 -> [lat, lon]
+SVG_MAP_WIDTH     = 1000         # viewBox units; the <img> scales to the card
+
+@st.cache_resource
+def country_centroids() -> dict[str, tuple[float, float]]:
+    return {k: (float(v[0]), float(v[1])) for k, v in json.loads(COUNTRY_CENTROIDS.read_text(encoding="utf-8")).items()}
+
+def colorscale_rgb(t: np.ndarray, stops=MAP_COLORSCALE) -> list[str]:
+    """Positions in [0, 1] -> '#rrggbb', linear between the Plotly colour stops."""
+    pos = np.array([p for p, _ in stops])
+    rgb = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for _, c in stops], dtype=float)
+    chans = np.stack([np.interp(t, pos, rgb[:, k]) for k in range(3)], axis=-1).round().astype(int)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in chans]
+
+def build_svg_map(choro_df: pd.DataFrame) -> str:
+    """
+    Server-side map as SVG: every country a faint dot at its centroid (equirectangular),
+    countries with views a bubble coloured with build_choropleth's log scale and
+    colour stops. The plain placeholder in assets/worldmap.svg has no country shapes,
+    so centroids stand in for paths. Colour bar unless HIDE_CB.
+    """
+    cents = country_centroids()
+    lat0, lat1 = MAP_LAT_RANGE
+    w = SVG_MAP_WIDTH
+    h_geo = w * (lat1 - lat0) / 360
+    legend_h = 0 if HIDE_CB else 46
+    def xy(lat, lon):
+        return (lon + 180) / 360 * w, (lat1 - min(max(lat, lat0), lat1)) / (lat1 - lat0) * h_geo
+
+    parts = [f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {w} {h_geo + legend_h:.0f}' "
+             f"font-family='sans-serif' font-size='13'>",
+             f"<rect width='{w}' height='{h_geo:.0f}' fill='#070a0f'/>"]
+    parts += [f"<circle cx='{x:.1f}' cy='{y:.1f}' r='2.2' fill='rgba(255,255,255,.10)'/>"
+              for x, y in (xy(*c) for c in cents.values())]
+
+    df = choro_df[choro_df["iso3"].isin(cents.keys())]
+    z_raw = df["views"].astype(int).clip(lower=0)
+    if len(df):
+        z = np.log10(z_raw.to_numpy() + 1)
+        zmin, zmax = float(z.min()), float(z.max())
+        t = (z - zmin) / (zmax - zmin) if zmax > zmin else np.ones_like(z)
+        colors = colorscale_rgb(t)
+        for i in np.argsort(t, kind="stable"):   # biggest drawn last (on top)
+            x, y = xy(*cents[df["iso3"].iat[i]])
+            label = html.escape(f"{df['name'].iat[i]}: {z_raw.iat[i]:,} views", quote=True)
+            parts.append(f"<circle cx='{x:.1f}' cy='{y:.1f}' r='{4 + 10 * t[i]:.1f}' fill='{colors[i]}' "
+                         f"fill-opacity='.85' stroke='rgba(255,255,255,.35)' stroke-width='.8'><title>{label}</title></circle>")
+
+        if not HIDE_CB:
+            x0, bar_w, y0 = w * 0.04, w * 0.92, h_geo + 10
+            parts.append("<defs><linearGradient id='cb'>" + "".join(
+                f"<stop offset='{p:.2f}' stop-color='{c}'/>" for p, c in MAP_COLORSCALE) + "</linearGradient></defs>")
+            parts.append(f"<rect x='{x0:.0f}' y='{y0:.0f}' width='{bar_w:.0f}' height='12' fill='url(#cb)'/>")
+            tickvals, ticktext = _adaptive_ticks(int(z_raw.max()))
+            for tv, tt in zip(tickvals, ticktext):
+                if zmax > zmin and zmin <= tv <= zmax:
+                    tx = x0 + bar_w * (tv - zmin) / (zmax - zmin)
+                    parts.append(f"<text x='{tx:.0f}' y='{y0 + 30:.0f}' fill='#aab3c5' text-anchor='middle'>{tt}</text>")
+    parts.append("</svg>")
+    return "".join(parts)
+
+def cached_svg_map(choro_df: pd.DataFrame) -> str:
+    """build_svg_map as a data: URI for an <img>, built once per distinct content."""
+    key = "svg:" + frame_digest(choro_df, ["iso3", "name", "views"], HIDE_CB)
+    return _figure_memo(key, lambda: "data:image/svg+xml;base64,"
+                        + base64.b64encode(build_svg_map(choro_df).encode("utf-8")).decode("ascii"))
 
 def oauth_channel_identity(client_id: str, client_secret: str, refresh_token: str) -> dict:
     """
@@ -768,20 +1369,10 @@ def oauth_channel_identity(client_id: str, client_secret: str, refresh_token: st
     if not GOOGLE_OK:
         raise RuntimeError("Google client libraries unavailable.")
 
-    creds = UserCredentials(
-        None,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=client_id,
-        client_secret=client_secret,
-        scopes=["https://www.googleapis.com/auth/yt-analytics.readonly",
-                "https://www.googleapis.com/auth/youtube.readonly"],
-    )
-    if not creds.valid:
-        creds.refresh(Request())
+    creds = oauth_credentials(client_id, client_secret, refresh_token)
 
-    yt = build("youtube", "v3", credentials=creds, cache_discovery=False)
-    info = yt.channels().list(part="snippet,statistics", mine=True).execute()
+    yt = google_service("youtube", "v3")
+    info = yt.channels().list(part="snippet,statistics", mine=True).execute(http=oauth_http(creds))
     item = (info.get("items") or [{}])[0]
 
     return {
@@ -792,7 +1383,6 @@ def oauth_channel_identity(client_id: str, client_secret: str, refresh_token: st
     }
 
 # ---- YouTube Analytics: daily views (last N days) ----
-@st.cache_data(ttl=300)
 def yt_analytics_daily_lastN(
     client_id: str,
     client_secret: str,
@@ -803,44 +1393,11 @@ def yt_analytics_daily_lastN(
     """
     Returns a DataFrame with columns: ['date', 'views'] for the last N days.
     Uses *yesterday* as end date (Studio shows complete days).
+    (channel_id is ignored: the OAuth-authorized channel is always used.)
     """
     if not GOOGLE_OK:
         raise RuntimeError("Google client libraries unavailable.")
-
-    creds = UserCredentials(
-        None,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=client_id,
-        client_secret=client_secret,
-        scopes=["https://www.googleapis.com/auth/yt-analytics.readonly",
-                "https://www.googleapis.com/auth/youtube.readonly"],
-    )
-    if not creds.valid:
-        creds.refresh(Request())
-
-    analytics = build("youtubeAnalytics", "v2", credentials=creds, cache_discovery=False)
-
-    end_date = (datetime.now(LOCAL_TZ).date() - timedelta(days=1))          # yesterday
-    start_date = end_date - timedelta(days=days - 1)                   # inclusive window
-    # ids_val = f"channel=={channel_id}" if channel_id else "channel==MINE"
-    ids_val = "channel==MINE"  # ← force OAuth-authorized channel
-
-    resp = analytics.reports().query(
-        ids=ids_val,
-        startDate=start_date.isoformat(),
-        endDate=end_date.isoformat(),
-        metrics="views",
-        dimensions="day",
-        sort="day",
-    ).execute()
-
-    rows = resp.get("rows", []) or []
-    df = pd.DataFrame(rows, columns=["date", "views"])
-    if not df.empty:
-        df["date"] = pd.to_datetime(df["date"])
-        df["views"] = df["views"].astype(int)
-    return df
+    return _analytics_daily_for_refresh_token(client_id, client_secret, refresh_token, days=days)
 
 def normalize_daily_to_local(daily_df: pd.DataFrame, tz: str) -> pd.DataFrame:
     """
@@ -905,81 +1462,290 @@ STUDIO_COUNTRY_VIEWS = {
     # "Uganda": <value not shown in your list>
 }
 
-# Name → ISO3 overrides for tricky names
-ISO3_OVERRIDES = {
-    "United States": "USA",
-    "United Kingdom": "GBR",
-    "South Korea": "KOR",
-    "North Korea": "PRK",
-    "Myanmar (Burma)": "MMR",
-    "Taiwan": "TWN",
-    "Hong Kong": "HKG",
-    "United Arab Emirates": "ARE",
-    "Vietnam": "VNM",
-    "Czechia": "CZE",
-    "Ivory Coast": "CIV",
-    "Côte d’Ivoire": "CIV",
-    "Russia": "RUS",
-    "Syria": "SYR",
-    "Palestine": "PSE",
-    "Tanzania": "TZA",
-    "DR Congo": "COD",
-    "Republic of the Congo": "COG",
-    "Eswatini": "SWZ",
-    "Cabo Verde": "CPV",
-    "Micronesia": "FSM",
-    "Papua New Guinea": "PNG",
-    "North Macedonia": "MKD",
+def build_choro_dataframe(views_by_name: dict) -> pd.DataFrame:
+    """
+    One row for EVERY country in the world (iso3, name, views), views=0 where we
+    don't have data. Names are matched through the country dimension's aliases.
+    """
+    given = join_countries(pd.DataFrame({"country": list(views_by_name), "views": list(views_by_name.values())}), "country")
+    views = given.dropna(subset=["iso3"]).groupby("iso3")["views"].sum().astype(int)
+    df = country_dim()["countries"][["iso3", "name"]].copy()
+    df["views"] = df["iso3"].map(views).fillna(0).astype(int)
+    return df.reset_index(drop=True)
+
+# ---- ClickUp sync engine (local task index per list / view) --------------------
+CLICKUP_PAGE_SIZE    = 100       # tasks per page on every task endpoint
+CLICKUP_MAX_TASKS    = 500       # per list / view
+CLICKUP_WORKERS      = 6         # concurrent ClickUp requests across all views
+CLICKUP_SPEC_PAGES   = 2         # pages requested at once per view after a full page 0
+CLICKUP_FULL_RESYNC  = 1800      # full reload every 30 min (drops deleted tasks)
+CLICKUP_SYNC_OVERLAP = 60_000    # ms re-requested on every delta (clock skew / same-ms edits)
+
+def _clickup_get_tasks(token: str, url: str, params: dict) -> list[dict]:
+    r = http_request(url, params=params, headers={"Authorization": token})
+    return (r.json() or {}).get("tasks", [])
+
+def _clickup_view_page(token: str, view_id: str, page: int) -> list[dict]:
+    return _clickup_get_tasks(token, f"https://api.clickup.com/api/v2/view/{view_id}/task",
+                              {"include_closed": "false", "subtasks": "true", "page": page})
+
+def _clickup_paged(token: str, url: str, params: dict) -> list[dict]:
+    """Sequential pages until a short page or CLICKUP_MAX_TASKS."""
+    out, page = [], 0
+    while True:
+        tasks = _clickup_get_tasks(token, url, {**params, "page": page})
+        out.extend(tasks)
+        if len(tasks) < CLICKUP_PAGE_SIZE or len(out) >= CLICKUP_MAX_TASKS:
+            return out[:CLICKUP_MAX_TASKS]
+        page += 1
+
+def _clickup_fetch_views(token: str, view_ids) -> tuple[dict[str, list], dict[str, str]]:
+    """
+    Full load of several views at once (bounded by CLICKUP_WORKERS).
+    Page 0 of all views goes out together; a view whose last page was full gets its
+    next CLICKUP_SPEC_PAGES pages requested speculatively, wave by wave, until a short page.
+    """
+    items: dict[str, list] = {v: [] for v in view_ids}
+    errors: dict[str, str] = {}
+    next_page = {v: 0 for v in view_ids}
+    open_views = set(view_ids)
+
+    with ThreadPoolExecutor(max_workers=CLICKUP_WORKERS, thread_name_prefix="clickup") as ex:
+        while open_views:
+            wave = {}
+            for v in open_views:
+                n_pages = 1 if next_page[v] == 0 else CLICKUP_SPEC_PAGES
+                for page in range(next_page[v], next_page[v] + n_pages):
+                    wave[ex.submit(_clickup_view_page, token, v, page)] = (v, page)
+            results: dict[tuple, list] = {}
+            for f, (v, page) in wave.items():
+                try:
+                    results[(v, page)] = f.result()
+                except Exception as e:
+                    errors[v] = f"ClickUp View API error: {e}"
+            for v in list(open_views):
+                if v in errors:
+                    open_views.discard(v)
+                    continue
+                pages = sorted(p for (vv, p) in results if vv == v)
+                for page in pages:
+                    tasks = results[(v, page)]
+                    items[v].extend(tasks)
+                    next_page[v] = page + 1
+                    if len(tasks) < CLICKUP_PAGE_SIZE or len(items[v]) >= CLICKUP_MAX_TASKS:
+                        open_views.discard(v)
+                        break
+    return {v: items[v][:CLICKUP_MAX_TASKS] for v in view_ids}, errors
+
+def _task_closed(t: dict) -> bool:
+    return (t.get("status") or {}).get("type", "") in ("closed", "done") or bool(t.get("archived"))
+
+class ClickUpTaskIndex:
+    """
+    Local copy of the open tasks in one ClickUp list or view. After a full load only
+    tasks changed since the last sync (date_updated_gt) are requested and merged in:
+    closed tasks drop out, deleted ones go on the next full resync (or webhook).
+    """
+
+    def __init__(self, kind: str, obj_id: str):
+        self.kind, self.obj_id = kind, obj_id
+        self.tasks: dict[str, dict] = {}
+        self.max_updated = 0      # newest date_updated seen (ms)
+        self.last_full = 0.0      # time.time() of the last full load
+        self.lock = threading.Lock()
+        self.stats = {"full": 0, "delta": 0, "changed": 0}
+
+    def needs_full(self) -> bool:
+        return not self.last_full or time.time() - self.last_full > CLICKUP_FULL_RESYNC
+
+    def delta_since(self) -> int:
+        return max(0, self.max_updated - CLICKUP_SYNC_OVERLAP)
+
+    def _seen(self, t: dict) -> None:
+        try:
+            self.max_updated = max(self.max_updated, int(t.get("date_updated") or 0))
+        except (TypeError, ValueError):
+            pass
+
+    def load_full(self, tasks: list[dict]) -> None:
+        with self.lock:
+            self.tasks = {t["id"]: t for t in tasks if t.get("id") and not _task_closed(t)}
+            for t in tasks:
+                self._seen(t)
+            self.last_full = time.time()
+            self.stats["full"] += 1
+
+    def merge(self, changed: list[dict], insert_unknown: bool = True, member=None) -> list[dict]:
+        """
+        Apply changed tasks. member(task) -> True / False / None says whether an open
+        task belongs here (None: can't tell). Returns open tasks of unknown membership
+        that aren't indexed yet when insert_unknown is False (caller reloads the view).
+        """
+        unknown = []
+        with self.lock:
+            for t in changed:
+                tid = t.get("id")
+                self._seen(t)
+                if not tid:
+                    continue
+                verdict = None if _task_closed(t) or member is None else member(t)
+                if _task_closed(t) or verdict is False:
+                    self.tasks.pop(tid, None)
+                elif verdict or tid in self.tasks or insert_unknown:
+                    self.tasks[tid] = t
+                else:
+                    unknown.append(t)
+            self.stats["delta"] += 1
+            self.stats["changed"] += len(changed)
+        return unknown
+
+    def upsert(self, task: dict) -> None:
+        self.merge([task], insert_unknown=True)
+
+    def remove(self, task_id: str) -> bool:
+        with self.lock:
+            return self.tasks.pop(task_id, None) is not None
+
+    def invalidate(self) -> None:
+        """Force a full load on the next sync."""
+        with self.lock:
+            self.last_full = 0.0
+
+    def snapshot(self) -> list[dict]:
+        with self.lock:
+            return list(self.tasks.values())
+
+@st.cache_resource
+def clickup_indexes() -> dict:
+    return {"lock": threading.Lock(), "by_key": {}}
+
+def clickup_index(kind: str, obj_id: str) -> ClickUpTaskIndex:
+    reg = clickup_indexes()
+    with reg["lock"]:
+        idx = reg["by_key"].get((kind, obj_id))
+        if idx is None:
+            idx = reg["by_key"][(kind, obj_id)] = ClickUpTaskIndex(kind, obj_id)
+        return idx
+
+def clickup_sync_list(token: str, list_id: str) -> list[dict]:
+    """Open tasks of a List from its index: full load first, then date_updated_gt deltas."""
+    idx = clickup_index("list", list_id)
+    url = f"https://api.clickup.com/api/v2/list/{list_id}/task"
+    base = {"archived": "false", "subtasks": "true", "order_by": "due_date", "reverse": "false"}
+    if idx.needs_full():
+        idx.load_full(_clickup_paged(token, url, {**base, "include_closed": "false"}))
+    else:
+        # include_closed so tasks closed since the last sync come back and drop out
+        idx.merge(_clickup_paged(token, url, {**base, "include_closed": "true",
+                                               "date_updated_gt": idx.delta_since()}))
+    return idx.snapshot()
+
+@ttl_cache(ttl=CLICKUP_FULL_RESYNC)
+def _clickup_view_scope(token: str, view_id: str) -> dict | None:
+    """
+    Where a view's tasks live and which of them it shows, for team-level delta queries:
+    {"team_id", "params", "type", "filters"} or None if it can't be resolved (view then
+    always full-loads). Re-read once per full-resync period so filter edits are picked up.
+    """
+    view = (http_get(f"https://api.clickup.com/api/v2/view/{view_id}", headers={"Authorization": token}) or {}).get("view") or {}
+    teams = (http_get("https://api.clickup.com/api/v2/team", headers={"Authorization": token}) or {}).get("teams") or []
+    if len(teams) != 1:
+        return None
+    parent = view.get("parent") or {}
+    scope_param = {4: "space_ids[]", 5: "project_ids[]", 6: "list_ids[]"}.get(int(parent.get("type") or 0))
+    params = {scope_param: [str(parent["id"])]} if scope_param and parent.get("id") else {}
+    if not params and int(parent.get("type") or 0) != 7:   # 7 = whole workspace
+        return None
+    return {"team_id": str(teams[0]["id"]), "params": params,
+            "type": str(view.get("type") or ""), "filters": view.get("filters") or {}}
+
+# View filter fields we can evaluate locally: task -> the values the filter compares
+_CLICKUP_FILTER_FIELDS = {
+    "status":   lambda t: {str((t.get("status") or {}).get("status", "")).lower()},
+    "assignee": lambda t: {str(a.get("id")) for a in t.get("assignees") or []},
+    "tag":      lambda t: {str(g.get("name", "")).lower() for g in t.get("tags") or []},
+    "priority": lambda t: {str((t.get("priority") or {}).get("id", ""))} - {""},
 }
+_CLICKUP_DATED_VIEWS = ("calendar", "timeline", "gantt")   # only tasks with a start or due date show
 
-def name_to_iso3(name: str) -> str | None:
-    if name in ISO3_OVERRIDES:
-        return ISO3_OVERRIDES[name]
-    try:
-        return pycountry.countries.lookup(name).alpha_3
-    except Exception:
+def _clickup_filter_match(rule: dict, task: dict) -> bool | None:
+    """One view filter against one task: True / False, or None if we can't evaluate it."""
+    get = _CLICKUP_FILTER_FIELDS.get(str(rule.get("field", "")))
+    if get is None:
         return None
+    have = get(task)
+    want = {str(v).lower() if rule.get("field") in ("status", "tag") else str(v) for v in rule.get("values") or []}
+    op = str(rule.get("op", "")).upper().replace("_", " ")
+    if op in ("EQ", "ANY", "IS"):
+        return bool(have & want)
+    if op == "ALL":
+        return want <= have
+    if op in ("NOT", "NOT ANY", "IS NOT", "NOT EQ"):
+        return not (have & want)
+    return None
 
-def build_choro_dataframe(views_by_name: dict) -> pd.DataFrame:
+def _clickup_view_match(scope: dict, task: dict) -> bool | None:
     """
-    Build a dataframe with one row for EVERY country in the world (pycountry),
-    filling views=0 where we don't have data. Also returns nice local names.
+    Does this open task belong in the view? True / False when the view's filters can be
+    evaluated locally (status, assignee, tag, priority; dated views need a date),
+    None when they can't (unknown field or op, a text search, subtasks).
     """
-    # Map your provided names -> ISO3
-    mapped = {}
-    for nm, v in views_by_name.items():
-        iso3 = name_to_iso3(nm)
-        if iso3:
-            mapped[iso3] = int(v)
+    if scope.get("type") in _CLICKUP_DATED_VIEWS and not (task.get("start_date") or task.get("due_date")):
+        return False
+    filters = scope.get("filters") or {}
+    results = [_clickup_filter_match(f, task) for f in filters.get("fields") or []]
+    if str(filters.get("op", "AND")).upper() == "OR" and results:
+        verdict = True if True in results else (False if None not in results else None)
+    else:
+        verdict = False if False in results else (True if None not in results else None)
+    if verdict is False:
+        return False
+    if verdict is None or filters.get("search") or task.get("parent"):
+        return None
+    return True
 
-    # Base list: all countries (ISO3 + long name)
-    rows = []
-    for c in pycountry.countries:
-        iso3 = getattr(c, "alpha_3", None)
-        if not iso3:
+def clickup_sync_views(token: str, view_ids) -> tuple[dict[str, list], dict[str, str]]:
+    """
+    Open tasks of several Views from their indexes. The /view/{id}/task endpoint has
+    no filters, so deltas come from the workspace task search scoped to the view's
+    parent (date_updated_gt), then run through the view's own filters locally: tasks
+    that match are upserted, tasks that can't are dropped. Only a changed task the
+    view doesn't hold yet and whose membership can't be decided locally (unsupported
+    filter) makes that view reload in full.
+    """
+    view_ids = tuple(dict.fromkeys(v for v in view_ids if v))
+    errors: dict[str, str] = {}
+    full = [v for v in view_ids if clickup_index("view", v).needs_full()]
+    for v in view_ids:
+        if v in full:
             continue
-        rows.append({"iso3": iso3, "name": c.name, "views": mapped.get(iso3, 0)})
+        idx = clickup_index("view", v)
+        try:
+            scope = _clickup_view_scope(token, v)
+            if scope is None:
+                full.append(v)
+                continue
+            changed = _clickup_paged(
+                token, f"https://api.clickup.com/api/v2/team/{scope['team_id']}/task",
+                {**scope["params"], "subtasks": "true", "include_closed": "true",
+                 "date_updated_gt": idx.delta_since()},
+            )
+            if idx.merge(changed, insert_unknown=False, member=functools.partial(_clickup_view_match, scope)):
+                full.append(v)
+        except Exception:
+            full.append(v)
+    if full:
+        loaded, errors = _clickup_fetch_views(token, full)
+        for v, tasks in loaded.items():
+            if v not in errors:
+                clickup_index("view", v).load_full(tasks)
+    return {v: clickup_index("view", v).snapshot() for v in view_ids if v not in errors}, errors
 
-    df = pd.DataFrame(rows)
-    return df
-    
 # ---- ClickUp: upcoming tasks -------------------------------------------------
-@st.cache_data(ttl=120)
+@ttl_cache(ttl=120)
 def clickup_tasks_upcoming(token: str, list_id: str, limit: int = 12):
-    url = f"https://api.clickup.com/api/v2/list/{list_id}/task"
-    headers = {"Authorization": token}
-    params = {
-        "archived": "false",
-        "subtasks": "true",
-        "order_by": "due_date",
-        "reverse": "false",
-        "page": 0,
-        "include_closed": "false",
-    }
     try:
-        r = requests.get(url, headers=headers, params=params, timeout=20)
-        r.raise_for_status()
-        items = (r.json() or {}).get("tasks", [])
+        items = clickup_sync_list(token, list_id)
     except Exception as e:
         return [], f"ClickUp error: {e}"
 
@@ -1038,11 +1804,130 @@ def _secret_missing(name: str) -> bool:
 import requests
 from datetime import datetime
 
-@st.cache_data(ttl=120)
-def get_volunteer_calendar(token: str, view_id: str, limit: int = 12):
-    return clickup_calendar_events_from_view(token, view_id, limit=limit, tz_name=LOCAL_TZ_NAME)
+# ---- Calendar engine (columnar events + interval index) ----
+CALENDAR_LIMIT = 12              # rows per calendar card
+
+def calendar_table(tasks: list[dict], tz) -> pd.DataFrame:
+    """
+    ClickUp tasks -> one event per row (id, title, url, start, end, assignees), sorted
+    by start. Multi-day spans come from start_date + due_date; either one alone makes
+    a point event. Timestamps are converted as whole columns, not task by task.
+    """
+    def col(key):
+        return pd.Series([t.get(key) for t in tasks], dtype=object)
+
+    start_ms = pd.to_numeric(col("start_date"), errors="coerce")
+    due_ms   = pd.to_numeric(col("due_date"), errors="coerce")
+    start_ms, end_ms = start_ms.fillna(due_ms), due_ms.fillna(start_ms)
+    keep = start_ms.notna().to_numpy()
+
+    start = pd.to_datetime(start_ms[keep], unit="ms", utc=True).dt.tz_convert(tz)
+    end   = pd.to_datetime(end_ms[keep], unit="ms", utc=True).dt.tz_convert(tz)
+    kept = [t for t, k in zip(tasks, keep) if k]
+    df = pd.DataFrame({
+        "id":        [str(t.get("id") or "") for t in kept],
+        "title":     [t.get("name") or "Untitled" for t in kept],
+        "url":       [t.get("url") or "#" for t in kept],
+        "start":     start.array,
+        "end":       end.where(end >= start, start).array,
+        "assignees": [
+            [str(nm).split("@")[0].title()
+             for a in (t.get("assignees") or [])
+             if (nm := a.get("username") or a.get("email") or a.get("id"))]
+            for t in kept
+        ],
+    })
+    if df.empty:
+        df["start"] = df["end"] = pd.Series(dtype=f"datetime64[ns, {tz}]")
+    return df.sort_values(["start", "end"], kind="stable").reset_index(drop=True)
+
+class EventIndex:
+    """
+    Interval index over a calendar_table: events sorted by start plus a running max of
+    end. An overlap query is two binary searches; only rows between them are checked,
+    so "what's on now…horizon" / "who is out on D" stay cheap with thousands of events.
+    """
+
+    def __init__(self, table: pd.DataFrame):
+        self.table = table
+        self.tz = getattr(table["start"].dtype, "tz", None) or LOCAL_TZ
+        self._start = self._ns(table["start"])
+        self._end = self._ns(table["end"])
+        self._max_end = np.maximum.accumulate(self._end) if len(self._end) else self._end
+
+    @staticmethod
+    def _ns(col: pd.Series) -> np.ndarray:
+        return col.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy("datetime64[ns]").view("int64")
+
+    def _at(self, ts) -> int:
+        ts = pd.Timestamp(ts)
+        return (ts if ts.tzinfo else ts.tz_localize(self.tz)).value
+
+    def overlapping(self, lo, hi=None) -> pd.DataFrame:
+        """Events with start <= hi and end >= lo (hi=None: no upper bound), by start."""
+        lo = self._at(lo)
+        right = len(self._start) if hi is None else int(np.searchsorted(self._start, self._at(hi), side="right"))
+        left = int(np.searchsorted(self._max_end[:right], lo, side="left"))   # every end before here is < lo
+        hits = left + np.flatnonzero(self._end[left:right] >= lo)
+        return self.table.iloc[hits]
+
+    def upcoming(self, now=None, limit: int = CALENDAR_LIMIT, horizon=None) -> list[dict]:
+        """Next `limit` events still running at `now` or starting before `horizon`."""
+        now = now if now is not None else datetime.now(self.tz)
+        return self._rows(self.overlapping(now, horizon).head(limit))
+
+    def on_date(self, day: date) -> list[dict]:
+        """Events covering any part of a local calendar day (e.g. who is on leave)."""
+        lo = pd.Timestamp(day).tz_localize(self.tz)
+        hi = (pd.Timestamp(day) + pd.Timedelta(days=1)).tz_localize(self.tz) - pd.Timedelta(1, "ns")
+        return self._rows(self.overlapping(lo, hi))
+
+    @staticmethod
+    def _rows(df: pd.DataFrame) -> list[dict]:
+        rows = df.to_dict("records")
+        for r in rows:
+            r["assignees"] = list(r["assignees"])
+        return rows
+
+def fmt_event_range(ev: dict) -> Markup:
+    """'Mon, Sep 01 — 09:30' for timed same-day events, 'Mon, Sep 01 → Wed, Sep 03' otherwise."""
+    s, e = ev["start"], ev["end"]
+    return Markup("<b>{}</b>{}").format(s.strftime('%a, %b %d'),
+        f" — {s.strftime('%H:%M')}" if s.date() == e.date() and (s.hour or s.minute)
+        else f" → {e.strftime('%a, %b %d')}"
+    )
+
+@ttl_cache(ttl=120)
+def clickup_calendar_views(
+    token: str,
+    view_ids: tuple[str, ...],
+    tz_name: str = LOCAL_TZ_NAME,
+) -> dict[str, tuple[pd.DataFrame, str]]:
+    """
+    Every configured calendar *View* from its local task index (clickup_sync_views:
+    concurrent, incremental), as calendar_table frames — query them with EventIndex.
+    A task that shows up in several views is converted once.
+    Returns {view_id: (events table, error_message)} — one view failing doesn't hide the others.
+    """
+    tz = pytz.timezone(tz_name)
+    view_ids = tuple(dict.fromkeys(v for v in view_ids if v))
+
+    items, errors = clickup_sync_views(token, view_ids)
+
+    unique = {}
+    for v in view_ids:
+        for t in items.get(v, [])[:CLICKUP_MAX_TASKS]:
+            unique.setdefault(t.get("id") or id(t), t)
+    table = calendar_table(list(unique.values()), tz)
+    out = {}
+    for v in view_ids:
+        if v in errors:
+            out[v] = (table.iloc[:0], errors[v])
+            continue
+        ids = {str(t.get("id")) for t in items[v][:CLICKUP_MAX_TASKS]}
+        out[v] = (table[table["id"].isin(ids)].reset_index(drop=True), "")
+    return out
 
-@st.cache_data(ttl=120)
 def clickup_calendar_events_from_view(
     token: str,
     view_id: str,
@@ -1055,72 +1940,8 @@ def clickup_calendar_events_from_view(
     Skips fully past items.
     Returns (events, error_message). On HTTP errors, error_message contains details.
     """
-    headers = {"Authorization": token}
-    base = f"https://api.clickup.com/api/v2/view/{view_id}/task"
-
-    tz = pytz.timezone(tz_name)
-    now_local = datetime.now(tz)
-
-    all_items, page, per_page = [], 0, 100
-
-    while True:
-        params = {
-            "include_closed": "false",
-            "subtasks": "true",
-            "page": page,
-        }
-        try:
-            r = requests.get(base, headers=headers, params=params, timeout=25)
-            r.raise_for_status()
-            items = (r.json() or {}).get("tasks", [])
-        except Exception as e:
-            return [], f"ClickUp View API error: {e}"
-
-        if not items:
-            break
-
-        all_items.extend(items)
-        if len(items) < per_page or len(all_items) >= 500:
-            break
-        page += 1
-
-    events = []
-    for t in all_items:
-        start_ms = t.get("start_date")
-        end_ms   = t.get("due_date")
-
-        if not start_ms and not end_ms:
-            continue
-
-        try:
-            if start_ms:
-                start_dt = datetime.utcfromtimestamp(int(start_ms)/1000).replace(tzinfo=pytz.UTC).astimezone(tz)
-            else:
-                start_dt = datetime.utcfromtimestamp(int(end_ms)/1000).replace(tzinfo=pytz.UTC).astimezone(tz)
-            end_dt = datetime.utcfromtimestamp(int((end_ms or start_ms))/1000).replace(tzinfo=pytz.UTC).astimezone(tz)
-        except Exception:
-            continue
-
-        if end_dt < now_local:
-            continue
-
-        # Collect assignees
-        assignees = []
-        for a in (t.get("assignees") or []):
-            nm = a.get("username") or a.get("email") or a.get("id")
-            if nm:
-                assignees.append(nm.split("@")[0].title())
-
-        events.append({
-            "title": t.get("name", "Untitled"),
-            "url": t.get("url") or "#",
-            "start": start_dt,
-            "end": end_dt,
-            "assignees": assignees,
-        })
-
-    events.sort(key=lambda e: (e["start"], e["end"]))
-    return events[:limit], ""
+    table, err = clickup_calendar_views(token, (view_id,), tz_name=tz_name)[view_id]
+    return (EventIndex(table).upcoming(limit=limit) if not err else []), err
 
 # ---- Google Sheets: Ministry & Filming (READ ONLY) ----------------------------
 import re
@@ -1141,69 +1962,184 @@ def gs_client():
     )
     return gspread.authorize(creds)
 
-def _open_ws(doc_id: str, worksheet: str):
-    gc = gs_client()
-    sh = gc.open_by_key(doc_id)
-    return sh.worksheet(worksheet)
+SHEETS_WORKERS = 4               # spreadsheets fetched concurrently
+SHEETS_NO_REV_TTL = 60           # when Drive won't report a revision, re-download at most this often
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files/{}"
+
+class SheetRevisionCache:
+    """
+    Parsed worksheets (and results derived from them) per spreadsheet revision.
+    A refresh first asks Drive for the file's version — a few bytes — and only
+    downloads values when it moved, so checking every few seconds costs next to nothing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs: dict[str, dict] = {}      # doc_id -> {"rev", "at", "frames": {ws: df}}
+        self._derived: dict = {}              # key -> (revs, value)
+        self.stats = {"checks": 0, "unchanged": 0, "downloads": 0}
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def frames(self, doc_id: str, rev: str | None, worksheets) -> dict | None:
+        """
+        Cached frames for these worksheets if the doc is still at `rev`. With no revision
+        (Drive metadata unreadable) a download younger than SHEETS_NO_REV_TTL is reused.
+        """
+        with self._lock:
+            hit = self._docs.get(doc_id)
+            if not hit or not set(worksheets) <= hit["frames"].keys():
+                return None
+            if rev is None:
+                if time.time() - hit["at"] >= SHEETS_NO_REV_TTL:
+                    return None
+            elif hit["rev"] != rev:
+                return None
+            return {ws: hit["frames"][ws] for ws in worksheets}
+
+    def store(self, doc_id: str, rev: str | None, frames: dict) -> None:
+        with self._lock:
+            hit = self._docs.get(doc_id)
+            if hit and hit["rev"] == rev:
+                hit["frames"].update(frames)
+                hit["at"] = time.time()
+            else:
+                self._docs[doc_id] = {"rev": rev, "at": time.time(), "frames": dict(frames)}
+
+    def derived(self, key, revs: tuple, compute, copy_out: bool = True):
+        """
+        compute() once per combination of revisions (None = unknown, always recompute).
+        copy_out=False hands out the cached object itself — callers must not mutate it.
+        """
+        with self._lock:
+            hit = self._derived.get(key)
+        if hit and hit[0] == revs and None not in revs:
+            return copy.deepcopy(hit[1]) if copy_out else hit[1]
+        value = compute()
+        with self._lock:
+            self._derived[key] = (revs, value)
+        return copy.deepcopy(value) if copy_out else value
+
+    def summary(self) -> str:
+        st_ = self.stats
+        return f"{st_['unchanged']}/{st_['checks']} revision checks unchanged, {st_['downloads']} downloads"
+
+@st.cache_resource
+def sheets_cache() -> SheetRevisionCache:
+    return SheetRevisionCache()
+
+def sheet_revision(doc_id: str) -> str | None:
+    """Drive's version counter for the file (bumps on every edit); None if it can't be read."""
+    try:
+        r = gs_client().http_client.request("get", DRIVE_FILES_URL.format(doc_id),
+                                            params={"fields": "version,modifiedTime", "supportsAllDrives": True})
+        meta = r.json()
+    except Exception:
+        return None
+    return str(meta.get("version") or meta.get("modifiedTime") or "") or None
+
+def _a1_sheet(worksheet: str) -> str:
+    """A1 range covering a whole worksheet ('It''s' quoting)."""
+    return "'" + worksheet.replace("'", "''") + "'"
+
+def _batch_get_doc(doc_id: str, worksheets: tuple[str, ...]) -> dict[str, list[list[str]]]:
+    """Every worksheet of one spreadsheet in a single values:batchGet (no metadata calls)."""
+    resp = gs_client().http_client.values_batch_get(doc_id, [_a1_sheet(w) for w in worksheets])
+    ranges = (resp or {}).get("valueRanges", [])
+    return {w: (ranges[i].get("values", []) if i < len(ranges) else []) for i, w in enumerate(worksheets)}
+
+def _read_doc(doc_id: str, worksheets: tuple[str, ...]) -> tuple[dict[str, pd.DataFrame], str | None]:
+    """Frames for one spreadsheet: from the revision cache when unchanged, else one batchGet."""
+    cache = sheets_cache()
+    rev = sheet_revision(doc_id)
+    cache.count("checks")
+    frames = cache.frames(doc_id, rev, worksheets)
+    if frames is not None:
+        cache.count("unchanged")
+        return frames, rev
+    values = _batch_get_doc(doc_id, worksheets)
+    frames = {ws: sheet_frame(values[ws]) for ws in worksheets}
+    cache.count("downloads")
+    cache.store(doc_id, rev, frames)
+    return frames, rev
+
+def read_sheets_rev(wanted: tuple[tuple[str, str], ...]) -> tuple[dict[tuple[str, str], pd.DataFrame], dict[str, str | None]]:
+    """
+    Several (doc_id, worksheet) pairs at once, spreadsheets checked/fetched concurrently.
+    Returns ({(doc_id, worksheet): sheet_frame}, {doc_id: revision}).
+    """
+    by_doc: dict[str, tuple[str, ...]] = {}
+    for doc_id, ws in wanted:
+        by_doc[doc_id] = tuple(dict.fromkeys(by_doc.get(doc_id, ()) + (ws,)))
+    with ThreadPoolExecutor(max_workers=min(SHEETS_WORKERS, len(by_doc) or 1), thread_name_prefix="sheets") as ex:
+        futs = {doc_id: ex.submit(_read_doc, doc_id, wss) for doc_id, wss in by_doc.items()}
+        done = {doc_id: f.result() for doc_id, f in futs.items()}
+    # copies: callers may rename/mutate, the cached frames must stay as parsed
+    frames = {(doc_id, ws): done[doc_id][0][ws].copy() for doc_id, ws in wanted}
+    return frames, {doc_id: rev for doc_id, (_, rev) in done.items()}
+
+def read_sheets(wanted: tuple[tuple[str, str], ...]) -> dict[tuple[str, str], pd.DataFrame]:
+    """One values:batchGet per changed spreadsheet; unchanged ones come from the revision cache."""
+    return read_sheets_rev(wanted)[0]
 
-@st.cache_data(ttl=60)
 def read_sheet(doc_id: str, worksheet: str) -> pd.DataFrame:
+    return read_sheets(((doc_id, worksheet),))[(doc_id, worksheet)]
+
+HEADER_SCAN_ROWS = 20            # rows searched for the header
+HEADER_KEYWORDS  = frozenset({"date", "time", "title", "event", "timeslot", "when"})
+_HDR_NONWORD     = re.compile(r"[^\w]+")
+
+def norm_header(v) -> str:
+    """Header cell -> lowercase snake_case ('Title:' -> 'title', ' Start Time ' -> 'start_time')."""
+    return _HDR_NONWORD.sub("_", str(v or "").strip().lower()).strip("_")
+
+@functools.lru_cache(maxsize=64)
+def _header_row(top: tuple[tuple[str, ...], ...]) -> tuple[int, tuple[str, ...]]:
+    """
+    Best header row among the top rows (keyword hits, then fullness) and its
+    normalized names. Cached per signature: the top of a sheet rarely changes.
     """
-    Read a worksheet and auto-detect which row contains headers.
+    best, best_score = 0, -1.0
+    for i, r in enumerate(top):
+        names = [norm_header(x) for x in r]
+        score = sum(n in HEADER_KEYWORDS for n in names) + 0.1 * sum(bool(str(x).strip()) for x in r)
+        if score > best_score:
+            best, best_score = i, score
+    return best, tuple(norm_header(x) for x in top[best]) if top else ()
+
+def sheet_frame(rows: list[list[str]]) -> pd.DataFrame:
+    """
+    Worksheet values -> DataFrame, auto-detecting which row contains headers.
     Normalizes headers to lowercase snake_case (e.g. 'Title:' -> 'title').
     Much more forgiving of preface rows and merged-header styles.
     """
-    import re
-    ws = _open_ws(doc_id, worksheet)
-    rows = ws.get_all_values()
     if not rows:
         return pd.DataFrame()
+    # The API trims trailing empty cells; the frame pads ragged rows back out
+    grid = pd.DataFrame(rows, dtype=object).fillna("")
+    top = tuple(tuple(map(str, r)) for r in grid.iloc[:HEADER_SCAN_ROWS].itertuples(index=False))
+    hdr_idx, names = _header_row(top)
 
-    # Helper: normalize a header cell to test intent
-    def norm_hdr(v: str) -> str:
-        s = re.sub(r"[^\w]+", "_", (v or "").strip().lower())
-        return re.sub(r"^_+|_+$", "", s)
-
-    # Scan the first 20 rows to find the best header row
-    header_row_idx = None
-    best_score = -1
-    for i, r in enumerate(rows[:20]):
-        # Score by presence of any likely header keywords
-        probes = [norm_hdr(x) for x in r]
-        score = sum(p in ("date", "time", "title", "event", "timeslot", "when") for p in probes)
-        # Prefer rows that aren't mostly empty
-        nonempty = sum(bool((x or "").strip()) for x in r)
-        score += 0.1 * nonempty
-        if score > best_score:
-            best_score = score
-            header_row_idx = i
-
-    if header_row_idx is None:
-        header_row_idx = 0  # ultimate fallback
-
-    header = rows[header_row_idx]
-    data   = rows[header_row_idx + 1:]
+    df = grid.iloc[hdr_idx + 1:]
+    keep = [i for i, raw in enumerate(top[hdr_idx]) if raw.strip()]   # drop unnamed columns
+    df = df.iloc[:, keep]
+    df.columns = [names[i] for i in keep]
 
-    # Build DataFrame and drop fully blank columns
-    df = pd.DataFrame(data, columns=header).fillna("")
-    df = df.loc[:, ~(df.columns.astype(str).str.strip() == "")]
-
-    # Normalize headers
-    def _norm(s):
-        s = str(s or "").strip().lower()
-        s = re.sub(r"[^\w]+", "_", s)
-        s = re.sub(r"^_+|_+$", "", s)
-        return s
-    df.columns = [_norm(c) for c in df.columns]
-
-    # Drop fully blank rows
+    # Drop fully blank rows (column-wise string ops, no per-row Python)
     if not df.empty:
-        df = df[~(df.apply(lambda r: all(str(x).strip()=="" for x in r), axis=1))]
+        blank = np.logical_and.reduce([df.iloc[:, k].astype(str).str.strip().eq("").to_numpy()
+                                       for k in range(df.shape[1])])
+        df = df[~blank]
 
     return df.reset_index(drop=True)
 
 # ---------- Ministry helpers (READ ONLY) ---------------------------------------
 def load_ministry_totals(doc_id: str, worksheet: str = "Ministry") -> dict:
+    return ministry_totals_from_df(read_sheet(doc_id, worksheet))
+
+def ministry_totals_from_df(df: pd.DataFrame) -> dict:
     """
     Supports either:
       A) tidy rows: [type, count]  -> sums by type
@@ -1211,7 +2147,6 @@ def load_ministry_totals(doc_id: str, worksheet: str = "Ministry") -> dict:
          Values can be plain numbers or text like '1 potential' — the first integer is used.
     """
     out = {"prayer": 0, "studies": 0, "follow_ups": 0, "baptisms": 0}
-    df = read_sheet(doc_id, worksheet)
     if df.empty:
         return out
 
@@ -1262,28 +2197,50 @@ def _first_nonempty(series: pd.Series, candidates: list[str]) -> str | None:
     return None
 
 def load_upcoming_filming(doc_id: str, worksheet: str = "Filming Integration", limit: int = 6) -> list[tuple[str, str, str]]:
+    return filming_from_df(read_sheet(doc_id, worksheet), limit=limit)
+
+_DMY_RE = r"^(\d{1,2})[/-](\d{1,2})(?:[/-](\d{2,4}))?$"
+
+def parse_sheet_dates(values: pd.Series, year: int) -> pd.Series:
     """
-    Returns up to limit rows as [(Mon, Aug 22, '09:20', 'Title'), ...].
-    More tolerant header matching + good debug.
+    Sheet date cells -> Timestamps (NaT when unparseable), whole column at once.
+    d/m[/yy] and d-m[-yy] (day first, year defaults to `year`) come from one str.extract;
+    everything else ('Aug 27', '27 Aug 2025'…) goes through one dayfirst to_datetime batch.
     """
-    import re
+    s = values.astype(str).str.strip()
+    parts = s.str.extract(_DMY_RE)
+    yr = pd.to_numeric(parts[2], errors="coerce").fillna(year)
+    yr = yr.where(yr >= 100, yr + 2000)
+    out = pd.to_datetime(
+        pd.DataFrame({"year": yr, "month": pd.to_numeric(parts[1], errors="coerce"),
+                      "day": pd.to_numeric(parts[0], errors="coerce")}),
+        errors="coerce",   # 31/2 etc. -> NaT, like before (no text fallback for d/m shapes)
+    )
+    text = parts[0].isna() & s.ne("")
+    if text.any():
+        try:
+            parsed = pd.to_datetime(s[text], dayfirst=True, format="mixed", errors="coerce")
+        except (ValueError, TypeError):   # e.g. mixed UTC offsets in one column
+            parsed = s[text].map(lambda v: pd.to_datetime(v, dayfirst=True, errors="coerce"))
+        if getattr(parsed.dtype, "tz", None) is not None:
+            parsed = parsed.dt.tz_localize(None)
+        out[text] = parsed
+    return out
 
-    df = read_sheet(doc_id, worksheet)
+def filming_schedule(df: pd.DataFrame, year: int) -> dict:
+    """
+    Parsed filming rows sorted both ways ({"asc", "desc"}: date, time_str, time_sort, title;
+    both None if the sheet has no usable date/title columns), plus the ?debug=1 diagnostics
+    ({"notes", "sample"}) for the script to show: this runs on the scheduler thread, where
+    st.* output goes nowhere. Depends only on the sheet contents (+ default year), so it's
+    cached per sheet revision.
+    """
+    out = {"asc": None, "desc": None, "notes": [], "sample": None}
     if df.empty:
-        if DEBUG: st.info("[filming] read_sheet returned EMPTY")
-        return []
-
-    # Normalize again (belt & suspenders) and strip stray underscores/spaces
-    def clean(s: str) -> str:
-        s = str(s or "").strip().lower()
-        s = re.sub(r"[^\w]+", "_", s)
-        s = re.sub(r"^_+|_+$", "", s)
-        # collapse things like 'title_' or 'date__' back to 'title'/'date'
-        s = s.rstrip("_")
-        return s
-
-    df.columns = [clean(c) for c in df.columns]
+        out["notes"].append("[filming] read_sheet returned EMPTY")
+        return out
 
+    # Headers arrive normalized by sheet_frame (snake_case, no stray underscores)
     # Be generous about what we accept for each field
     title_candidates = ("title", "what", "event", "piece", "song")
     date_candidates  = ("date", "day", "when", "shoot_date")
@@ -1303,110 +2260,95 @@ def load_upcoming_filming(doc_id: str, worksheet: str = "Filming Integration", l
     date_col  = pick(cols, date_candidates)
     time_col  = pick(cols, time_candidates)
 
-    if DEBUG:
-        st.info(f"[filming] columns={list(df.columns)}")
-        st.info(f"[filming] picked → title={title_col}, date={date_col}, time={time_col}")
+    out["notes"] += [f"[filming] columns={list(df.columns)}",
+                     f"[filming] picked → title={title_col}, date={date_col}, time={time_col}"]
 
     if not date_col or not title_col:
-        return []
-
-    today = pd.Timestamp.now(tz=LOCAL_TZ).normalize().tz_localize(None)
-    this_year = today.year
-
-    def parse_date(val: str) -> pd.Timestamp | None:
-        s = str(val or "").strip()
-        if not s:
-            return None
-    
-        # d/m[/yy] or d-m[-yy]
-        m = re.match(r"^\s*(\d{1,2})[/-](\d{1,2})(?:[/-](\d{2,4}))?\s*$", s)
-        if m:
-            d, mth, yr = int(m.group(1)), int(m.group(2)), m.group(3)
-            yr = int(yr) if yr else this_year
-            if yr < 100:
-                yr += 2000
-            try:
-                return pd.Timestamp(year=yr, month=mth, day=d)
-            except Exception:
-                return None
-    
-        # allow "Aug 27", "27 Aug", etc.
-        d = pd.to_datetime(s, dayfirst=True, errors="coerce")
-        return None if pd.isna(d) else pd.Timestamp(d)
-    
-    dates = df[date_col].apply(parse_date)
-    times = df[time_col].astype(str).str.strip() if time_col else pd.Series([""] * len(df))
-    times_sort = pd.to_datetime(times, format="%H:%M", errors="coerce") if time_col else pd.Series([pd.NaT] * len(df))
-    titles = df[title_col].astype(str).str.strip()
-
-    tmp = (pd.DataFrame({"date": dates, "time_str": times, "time_sort": times_sort, "title": titles})
-             .dropna(subset=["date"]))
+        return out
 
-    if DEBUG:
-        st.write("[filming] sample parsed rows:", tmp.head(12))
+    times = df[time_col].astype(str).str.strip() if time_col else pd.Series([""] * len(df), index=df.index)
+    tmp = (pd.DataFrame({
+               "date":      parse_sheet_dates(df[date_col], year),
+               "time_str":  times,
+               "time_sort": pd.to_datetime(times, format="%H:%M", errors="coerce"),
+               "title":     df[title_col].astype(str).str.strip(),
+           })
+           .dropna(subset=["date"]))
+
+    out["sample"] = tmp.head(12).reset_index(drop=True)
+    out["asc"]  = tmp.sort_values(["date", "time_sort"], kind="stable").reset_index(drop=True)
+    out["desc"] = tmp.sort_values(["date", "time_sort"], ascending=[False, False], kind="stable").reset_index(drop=True)
+    return out
 
-    if tmp.empty:
+def filming_from_schedule(sched: dict | None, limit: int = 6, today: pd.Timestamp | None = None,
+                          notes: list[str] | None = None) -> list[tuple[str, str, str]]:
+    """
+    Up to limit rows as [(Mon, Aug 22, '09:20', 'Title'), ...]: today onwards first,
+    then the most recent past slots if there aren't enough upcoming ones.
+    A diagnostics line is appended to notes, if given.
+    """
+    if not sched or sched["asc"] is None or sched["asc"].empty:
         return []
+    if today is None:
+        today = pd.Timestamp.now(tz=LOCAL_TZ).normalize().tz_localize(None)
+    asc, desc = sched["asc"], sched["desc"]
+    first_fut = int(asc["date"].searchsorted(today, side="left"))
+    fut = asc.iloc[first_fut:first_fut + limit]
+    n_fut = len(asc) - first_fut
+    past = desc[desc["date"] < today].head(max(0, limit - n_fut))
+    take = pd.concat([fut, past], axis=0)
+
+    out = list(zip(take["date"].dt.strftime("%a, %b %d"), take["time_str"].fillna(""), take["title"].fillna("")))
+    if notes is not None:
+        notes.append(f"[filming] out={len(out)} (fut={n_fut} past={len(asc) - n_fut})")
+    return out
 
-    # Future first; if not enough, backfill nearest past
-    fut  = tmp[tmp["date"] >= today].sort_values(["date", "time_sort"], kind="stable")
-    past = tmp[tmp["date"] <  today].sort_values(["date", "time_sort"], ascending=[False, False], kind="stable")
-
-    take = pd.concat([fut.head(limit), past.head(max(0, limit - len(fut)))], axis=0)
+def filming_from_df(df: pd.DataFrame, limit: int = 6) -> list[tuple[str, str, str]]:
+    today = pd.Timestamp.now(tz=LOCAL_TZ).normalize().tz_localize(None)
+    return filming_from_schedule(filming_schedule(df, today.year), limit=limit, today=today)
 
-    def fmt_date(d: pd.Timestamp) -> str:
-        return pd.to_datetime(d).strftime("%a, %b %d")
+# ---------- Both Sheets cards from one batched read ----------------------------
+def load_sheet_cards(min_doc: str, film_doc: str, min_ws: str = "Ministry",
+                     film_ws: str = "Filming Integration", limit: int = 6) -> dict:
+    """
+    Ministry totals + filming slots for one round-trip per spreadsheet (one total if
+    they share a doc). While neither sheet changes, only the revision checks go out
+    and the cards are reused as they are (recomputed at midnight: 'upcoming' moves).
+    """
+    frames, revs = read_sheets_rev(((min_doc, min_ws), (film_doc, film_ws)))
+    cache = sheets_cache()
+    today = pd.Timestamp.now(tz=LOCAL_TZ).normalize().tz_localize(None)
+    # Parsed + sorted schedule: once per filming sheet revision (read-only, shared)
+    schedule = cache.derived(
+        ("filming_schedule", film_doc, film_ws), (revs[film_doc], today.year),
+        lambda: filming_schedule(frames[(film_doc, film_ws)], today.year), copy_out=False,
+    )
 
-    out = [(fmt_date(r.date), (r.time_str or ""), r.title or "") for _, r in take.iterrows()]
-    if DEBUG: st.info(f"[filming] out={len(out)} (fut={len(fut)} past={len(past)})")
-    return out
+    def cards():
+        notes = list(schedule["notes"])
+        return {
+            "ministry":      ministry_totals_from_df(frames[(min_doc, min_ws)]),
+            "filming":       filming_from_schedule(schedule, limit=limit, today=today, notes=notes),
+            "filming_debug": {"notes": notes, "sample": schedule["sample"]},   # shown with ?debug=1
+        }
+    return cache.derived(
+        ("sheet_cards", min_doc, film_doc, min_ws, film_ws, limit),
+        (revs[min_doc], revs[film_doc], today.date().isoformat()),
+        cards,
+    )
 
-@st.cache_data(ttl=120)
+@ttl_cache(ttl=120)
 def clickup_calendar_events(token: str, list_id: str, limit: int = 10, tz_name: str = LOCAL_TZ_NAME):
     """Return upcoming events from ClickUp List, using start_date/due_date like Calendar view."""
-    url = f"https://api.clickup.com/api/v2/list/{list_id}/task"
-    headers = {"Authorization": token}
-    params = {
-        "archived": "false",
-        "subtasks": "true",
-        "include_closed": "false",
-        "page": 0,
-    }
     try:
-        r = requests.get(url, headers=headers, params=params, timeout=20)
-        r.raise_for_status()
-        items = (r.json() or {}).get("tasks", [])
+        items = clickup_sync_list(token, list_id)
     except Exception as e:
         return [], f"ClickUp Calendar API error: {e}"
 
     tz = pytz.timezone(tz_name)
-    now_local = datetime.now(tz)
-
-    events = []
-    for t in items:
-        start_ms = t.get("start_date")
-        end_ms   = t.get("due_date") or start_ms
-        if not start_ms:
-            continue
-
-        try:
-            start_dt = datetime.utcfromtimestamp(int(start_ms)/1000).replace(tzinfo=pytz.UTC).astimezone(tz)
-            end_dt   = datetime.utcfromtimestamp(int(end_ms)/1000).replace(tzinfo=pytz.UTC).astimezone(tz)
-        except Exception:
-            continue
-
-        if end_dt < now_local:
-            continue
-
-        events.append({
-            "title": t.get("name", "Untitled"),
-            "url": t.get("url") or "#",
-            "start": start_dt,
-            "end": end_dt,
-        })
-
-    events.sort(key=lambda e: e["start"])
-    return events[:limit], ""
+    # Like the List's Calendar view: only tasks with a start date
+    dated = [t for t in items if t.get("start_date")]
+    return EventIndex(calendar_table(dated, tz)).upcoming(limit=limit), ""
 
 # --- helpers to get ids cleanly
 def _get_clickup_ids():
@@ -1418,6 +2360,555 @@ def _get_clickup_ids():
     guest_view  = st.secrets.get("CLICKUP_GUEST_VIEW_ID", "")
     return token, list_id, view_id, vol_view_id, leave_view, guest_view
 
+def _get_oauth_bundles() -> list[dict]:
+    """
+    YouTube Analytics OAuth bundles from secrets, one per channel:
+      [[YT_OAUTH_BUNDLES]]  client_id / client_secret / refresh_token (+ optional name)
+    The name labels the channel in partial-failure notes ('12/13 channels').
+    """
+    out = []
+    for b in st.secrets.get("YT_OAUTH_BUNDLES", []) or []:
+        b = dict(b)
+        if b.get("client_id") and b.get("client_secret") and b.get("refresh_token"):
+            bundle = {k: b[k] for k in ("client_id", "client_secret", "refresh_token")}
+            if b.get("name") or b.get("label"):
+                bundle["name"] = str(b.get("name") or b.get("label"))
+            out.append(bundle)
+    return out
+
+# =======================
+# Durable on-disk cache tier
+# =======================
+DISK_CACHE_DIR     = DATA_DIR / "cache"
+DISK_CACHE_MAX_MB  = 64          # evict least-recently-written entries beyond this
+DISK_CACHE_MAX_AGE = 7 * 86400   # never serve anything older than this after a restart
+
+def _disk_encode(value, parts: list):
+    """JSON-safe form of a snapshot; DataFrames are split out into `parts` (stored as Parquet)."""
+    if isinstance(value, pd.DataFrame):
+        parts.append(value)
+        return {"__df__": len(parts) - 1}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_disk_encode(v, parts) for v in value]}
+    if isinstance(value, list):
+        return [_disk_encode(v, parts) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _disk_encode(v, parts) for k, v in value.items()}
+    if isinstance(value, datetime):
+        return {"__dt__": value.isoformat()}
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    return value
+
+def _disk_decode(obj, load_part):
+    if isinstance(obj, list):
+        return [_disk_decode(v, load_part) for v in obj]
+    if isinstance(obj, dict):
+        if "__df__" in obj:
+            return load_part(obj["__df__"])
+        if "__tuple__" in obj:
+            return tuple(_disk_decode(v, load_part) for v in obj["__tuple__"])
+        if "__dt__" in obj:
+            return datetime.fromisoformat(obj["__dt__"])
+        return {k: _disk_decode(v, load_part) for k, v in obj.items()}
+    return obj
+
+class DiskCache:
+    """
+    Second cache tier that survives redeploys, sleep/wake and crashes.
+    One <key>.json per entry (TTL metadata + JSON payload) plus zstd Parquet files for
+    any DataFrames inside it. Total size is bounded by DISK_CACHE_MAX_MB.
+    Disk problems are never fatal: the in-memory tier just runs without it.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        safe = re.sub(r"[^\w.-]+", "_", key)
+        return self.root / f"{safe}{suffix}"
+
+    def put(self, key: str, value, ttl: int, sig: str = "") -> None:
+        try:
+            parts: list = []
+            payload = _disk_encode(value, parts)
+            with self._lock:
+                self.root.mkdir(parents=True, exist_ok=True)
+                for i, df in enumerate(parts):
+                    tmp = self._path(key, f".{i}.parquet.tmp")
+                    df.to_parquet(tmp, compression="zstd", index=False)
+                    os.replace(tmp, self._path(key, f".{i}.parquet"))
+                meta = {"key": key, "sig": sig, "fetched_at": time.time(), "ttl": ttl,
+                        "parts": len(parts), "value": payload}
+                tmp = self._path(key, ".json.tmp")
+                tmp.write_text(json.dumps(meta), encoding="utf-8")
+                os.replace(tmp, self._path(key, ".json"))
+                self._evict()
+        except Exception:
+            pass
+
+    def get(self, key: str, sig: str = "", max_age: int = DISK_CACHE_MAX_AGE):
+        """(value, meta) for a usable entry, else (None, None)."""
+        try:
+            meta = json.loads(self._path(key, ".json").read_text(encoding="utf-8"))
+            if meta.get("sig") != sig or time.time() - meta["fetched_at"] > max_age:
+                return None, None
+            load = lambda i: pd.read_parquet(self._path(key, f".{i}.parquet"))
+            return _disk_decode(meta["value"], load), meta
+        except Exception:
+            return None, None
+
+    def _evict(self) -> None:
+        entries = []
+        for f in self.root.glob("*.json"):
+            stem = f.name[:-len(".json")]
+            files = [f, *self.root.glob(f"{glob_escape(stem)}.*.parquet")]
+            entries.append((f.stat().st_mtime, sum(x.stat().st_size for x in files), files))
+        total = sum(e[1] for e in entries)
+        for _, size, files in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            for x in files:
+                x.unlink(missing_ok=True)
+            total -= size
+
+@st.cache_resource
+def disk_cache() -> DiskCache:
+    return DiskCache(DISK_CACHE_DIR, DISK_CACHE_MAX_MB * 1024 * 1024)
+
+# =======================
+# Background refresh scheduler
+# =======================
+class RefreshScheduler:
+    """
+    Process-wide refresher shared by every connected TV.
+    Each data source gets its own daemon thread + cadence; reruns only read the
+    latest snapshot, so upstream calls scale with sources, not viewers × sources.
+    Snapshots are mirrored to the disk tier, so a restarted process renders the last
+    known data immediately and revalidates in the background.
+    """
+
+    def __init__(self, disk: DiskCache | None = None):
+        self._jobs: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._disk = disk
+
+    def register(self, name: str, fn, interval: int, *args, **kwargs) -> None:
+        """Start (or keep) a job. Re-registering with new args (e.g. secrets changed) restarts it."""
+        sig = repr((fn.__qualname__, args, sorted(kwargs.items())))
+        with self._lock:
+            job = self._jobs.get(name)
+            if job and job["sig"] == sig and job["thread"].is_alive():
+                job["interval"] = interval
+                return
+            if job:
+                job["stop"].set()
+                job["wake"].set()
+            job = {
+                "name": name, "sig": sig, "fn": fn, "args": args, "kwargs": kwargs, "interval": interval,
+                "disk_sig": hashlib.sha256(sig.encode()).hexdigest()[:16],
+                "value": None, "error": "", "fetched_at": None, "attempted_at": None, "busy": False,
+                "tick": threading.Condition(),
+                "ready": threading.Event(), "wake": threading.Event(), "stop": threading.Event(),
+            }
+            if self._disk:
+                value, meta = self._disk.get(name, sig=job["disk_sig"])
+                if meta:
+                    job["value"], job["fetched_at"] = value, meta["fetched_at"]
+                    job["ready"].set()
+            job["thread"] = threading.Thread(target=self._loop, args=(job,), name=f"refresh:{name}", daemon=True)
+            self._jobs[name] = job
+            job["thread"].start()
+
+    def _loop(self, job: dict) -> None:
+        if job["fetched_at"] is not None:
+            # Seeded from disk: only wait out whatever is left of its TTL
+            job["wake"].wait(max(0.0, job["interval"] - (time.time() - job["fetched_at"])))
+            job["wake"].clear()
+        while not job["stop"].is_set():
+            job["attempted_at"], job["busy"] = time.time(), True
+            try:
+                job["value"] = job["fn"](*job["args"], **job["kwargs"])
+                job["fetched_at"] = time.time()
+                job["error"] = ""
+                if self._disk:
+                    self._disk.put(job["name"], job["value"], ttl=job["interval"], sig=job["disk_sig"])
+            except Exception as e:
+                job["error"] = str(e)  # keep the last good value
+            finally:
+                job["busy"] = False
+                job["ready"].set()
+                with job["tick"]:
+                    job["tick"].notify_all()
+            job["wake"].wait(job["interval"])
+            job["wake"].clear()
+
+    def read(self, name: str, wait: float = 30.0):
+        """
+        Latest value for a source. Blocks only on a cold start (first fetch not done yet)
+        or when the snapshot is older than SCHED_MAX_STALENESS (e.g. a long sleep) and
+        no refresh is running or was tried within the job's interval, so a source that
+        keeps failing serves its last value instead of stalling every rerun.
+        Raises if the source has never produced a value.
+        """
+        job = self._jobs.get(name)
+        if job is None:
+            raise KeyError(f"Unknown data source: {name}")
+        job["ready"].wait(wait)
+        age = self.age(name)
+        if age is not None and age > SCHED_MAX_STALENESS:
+            with job["tick"]:
+                tried = job["attempted_at"]
+                if not job["busy"] and (tried is None or time.time() - tried > job["interval"]):
+                    job["attempted_at"] = time.time()  # concurrent reruns don't all wait
+                    job["wake"].set()
+                    job["tick"].wait(wait)
+        if job["fetched_at"] is None:
+            raise RuntimeError(job["error"] or f"{name}: still loading")
+        return job["value"]
+
+    def age(self, name: str) -> float | None:
+        """Seconds since the last successful refresh (None if never)."""
+        job = self._jobs.get(name)
+        if not job or job["fetched_at"] is None:
+            return None
+        return time.time() - job["fetched_at"]
+
+    def refresh_all(self) -> None:
+        """Wake every job now (used by ?clear_cache=1)."""
+        for job in list(self._jobs.values()):
+            job["wake"].set()
+
+    def poke(self, name: str) -> bool:
+        """Refresh one source now, skipping its fetcher cache (push invalidation)."""
+        job = self._jobs.get(name)
+        if job is None:
+            return False
+        if hasattr(job["fn"], "clear"):
+            job["fn"].clear()
+        job["wake"].set()
+        return True
+
+def fmt_age(secs: float | None) -> str:
+    if secs is None:
+        return ""
+    if secs < 60:
+        return "just now"
+    if secs < 3600:
+        return f"{int(secs // 60)}m ago"
+    if secs < 86400:
+        return f"{int(secs // 3600)}h ago"
+    return f"{int(secs // 86400)}d ago"
+
+def card_chip(source: str, status: list[dict] | None = None) -> str:
+    """
+    Right-aligned header chip with the card's data age ('3m ago') and, for multi-channel
+    cards, the bundle summary ('12/13 channels'; failures in the tooltip).
+    Turns red once the data is more than two refresh intervals old or a bundle failed.
+    """
+    bits, tips, warn = [], [], False
+    if status:
+        failed = [f"{s['bundle']}: {s['error']}" for s in status if not s["ok"]]
+        bits.append(bundle_status_summary(status))
+        tips.extend(failed)
+        warn = warn or bool(failed)
+    age = SCHED.age(source)
+    if age is not None:
+        bits.append(fmt_age(age))
+        tips.append(f"updated {datetime.now(LOCAL_TZ) - timedelta(seconds=age):%H:%M:%S}")
+        warn = warn or age > 2 * REFRESH_EVERY.get(source, 300)
+    if not bits:
+        return ""
+    color = "#ff6b6b" if warn else "var(--ink-dim)"
+    title = html.escape("; ".join(tips), quote=True)
+    return Markup(f"<span class='small' title='{title}' style='margin-left:auto;font-weight:600;color:{color}'>"
+                  f"{' · '.join(bits)}</span>")
+
+@st.cache_resource
+def refresh_scheduler() -> RefreshScheduler:
+    return RefreshScheduler(disk_cache())
+
+SCHED = refresh_scheduler()
+if CLEAR_CACHE:
+    ttl_clear_all()
+    SCHED.refresh_all()
+
+# ---- ClickUp webhooks (push invalidation) ----
+CLICKUP_WEBHOOK_EVENTS = ("taskCreated", "taskUpdated", "taskDeleted")
+CLICKUP_WEBHOOK_POLL   = 900     # ClickUp polling cadence while the receiver is up (safety net)
+CLICKUP_WEBHOOK_MAXLEN = 1 << 20 # request bodies above this are refused
+
+def _clickup_task_in_scope(token: str, view_id: str, task: dict) -> bool:
+    """Could this task belong to the view? (same list / folder / space as the view's parent)"""
+    scope = _clickup_view_scope(token, view_id)
+    if scope is None:
+        return True
+    if not scope["params"]:
+        return True   # workspace-wide view
+    ids = {
+        "list_ids[]":    (task.get("list") or {}).get("id"),
+        "project_ids[]": (task.get("folder") or {}).get("id"),
+        "space_ids[]":   (task.get("space") or {}).get("id"),
+    }
+    return any(str(ids.get(k)) in v for k, v in scope["params"].items())
+
+def apply_clickup_event(token: str, payload: dict) -> set[str]:
+    """
+    Apply one ClickUp webhook event to the task indexes in place.
+    Returns the scheduler sources whose cards changed.
+    """
+    event, task_id = payload.get("event"), str(payload.get("task_id") or "")
+    if event not in CLICKUP_WEBHOOK_EVENTS or not task_id:
+        return set()
+    reg = clickup_indexes()
+    with reg["lock"]:
+        indexes = list(reg["by_key"].values())
+    touched: list[ClickUpTaskIndex] = []
+    if event == "taskDeleted":
+        touched = [idx for idx in indexes if idx.remove(task_id)]
+    else:
+        # Webhook bodies only carry the id + history; fetch the task itself once
+        task = http_request(f"https://api.clickup.com/api/v2/task/{task_id}",
+                            headers={"Authorization": token}).json()
+        for idx in indexes:
+            known = task_id in idx.tasks
+            if idx.kind == "list":
+                if (task.get("list") or {}).get("id") == idx.obj_id:
+                    idx.merge([task])
+                elif known:
+                    idx.remove(task_id)   # moved to another list
+                else:
+                    continue
+            elif known or _clickup_task_in_scope(token, idx.obj_id, task):
+                # Same local filter check as the polled deltas (clickup_sync_views)
+                scope = _clickup_view_scope(token, idx.obj_id)
+                member = functools.partial(_clickup_view_match, scope) if scope else None
+                if idx.merge([task], insert_unknown=False, member=member):
+                    idx.invalidate()   # membership needs a filter we can't evaluate here
+                elif not known and task_id not in idx.tasks:
+                    continue           # filtered out of this view
+            else:
+                continue
+            touched.append(idx)
+    return {"clickup_tasks" if idx.kind == "list" else "calendars" for idx in touched}
+
+class _ClickUpWebhookHandler(BaseHTTPRequestHandler):
+    server_version = "LoudVoiceWebhook/1.0"
+
+    def _reply(self, code: int) -> None:
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        receiver: ClickUpWebhookReceiver = self.server.receiver
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > CLICKUP_WEBHOOK_MAXLEN:
+            return self._reply(413 if length else 400)
+        body = self.rfile.read(length)
+        if not receiver.verify(body, self.headers.get("X-Signature", "")):
+            receiver.count("rejected")
+            return self._reply(401)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return self._reply(400)
+        self._reply(200)   # ack first; ClickUp retries slow endpoints
+        receiver.submit(payload)
+
+    def log_message(self, *args):
+        pass
+
+class ClickUpWebhookReceiver:
+    """
+    Small HTTP server (own daemon thread) for ClickUp task webhooks.
+    Bodies are checked against X-Signature (HMAC-SHA256 of the raw body with the
+    webhook secret); events are applied one at a time, in arrival order, then the
+    affected scheduler sources are poked so every TV picks the change up at once.
+    """
+
+    def __init__(self, port: int, secret: str, token: str, scheduler: RefreshScheduler):
+        self.secret, self.token, self.scheduler = secret.encode(), token, scheduler
+        self.stats = {"received": 0, "applied": 0, "rejected": 0, "errors": 0, "last_event": None}
+        self._lock = threading.Lock()
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clickup-webhook")
+        self.server = ThreadingHTTPServer(("0.0.0.0", port), _ClickUpWebhookHandler)
+        self.server.daemon_threads = True
+        self.server.receiver = self
+        self.thread = threading.Thread(target=self.server.serve_forever, name="clickup-webhook", daemon=True)
+        self.thread.start()
+
+    def verify(self, body: bytes, signature: str) -> bool:
+        expected = hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature.strip().lower())
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def submit(self, payload: dict) -> None:
+        self.count("received")
+        self._worker.submit(self._apply, payload)
+
+    def _apply(self, payload: dict) -> None:
+        try:
+            sources = apply_clickup_event(self.token, payload)
+        except Exception:
+            self.count("errors")
+            return
+        for name in sources:
+            self.scheduler.poke(name)
+        with self._lock:
+            self.stats["applied"] += 1
+            self.stats["last_event"] = time.time()
+
+    def summary(self) -> str:
+        st_ = self.stats
+        last = fmt_age(time.time() - st_["last_event"]) if st_["last_event"] else "never"
+        return (f"{st_['applied']}/{st_['received']} events applied, {st_['rejected']} rejected, "
+                f"{st_['errors']} failed; last {last}")
+
+@st.cache_resource
+def clickup_webhook(port: int, secret: str, token: str) -> ClickUpWebhookReceiver:
+    return ClickUpWebhookReceiver(port, secret, token, refresh_scheduler())
+
+# ---- Card templates (each card is one st.markdown) ----
+# Compiled once per process; autoescaped, so task names, titles and error text are
+# safe as-is. Values that are already HTML (card_chip, fmt_event_range) are Markup.
+# No blank or 4-space-indented lines in the output: Markdown would break the HTML block.
+CARD_TEMPLATES = {
+    "card": (
+        "<div class='card'{% if style %} style='{{ style }}'{% endif %}>"
+        "<div class='section'>{{ title }}{{ chip }}</div>"
+        "{% block body %}{% endblock %}</div>"
+    ),
+    "note": "<div class='small'>{{ text }}</div>",
+    "tasks": (
+        "{% extends 'card' %}{% block body %}{% for t in tasks %}"
+        "<div class='grid-tasks-2'>"
+        "<div><a href='{{ t.url }}' target='_blank' style='color:#eef3ff;text-decoration:none'><b>{{ t.name }}</b></a>"
+        "{% if t.who %}<span class='chip'>{{ t.who }}</span>{% endif %}"
+        "<div><span class='small'>{{ t.status }}{% if t.due_str %} · due {{ t.due_str }}{% endif %}"
+        "{% if t.overdue %} <b style='color:#ff6b6b'>(overdue)</b>{% endif %}</span></div></div>"
+        "<div class='hbar'><span style='width:{{ t.pct }}%; background:{{ t.status_hex }}'></span></div>"
+        "</div>{% endfor %}{% endblock %}"
+    ),
+    "filming": (
+        "{% extends 'card' %}{% block body %}"
+        "{% for daydate, time_str, label in rows %}"
+        "<div class='film-row'><div><b>{{ daydate }}</b> — {{ time_str }}</div>"
+        "<div class='film-right'>{{ label }}</div></div>"
+        "{% else %}{% include 'note' %}{% endfor %}{% endblock %}"
+    ),
+    "calendar": (
+        "{% extends 'card' %}{% block body %}"
+        "{% if text %}{% include 'note' %}"
+        "{% else %}{% if out_today %}<div class='small'>Out today: <b>{{ out_today | join(', ') }}</b></div>{% endif %}"
+        "{% for ev in events %}"
+        "<div class='film-row'><div>{{ ev | event_range }}</div><div class='film-right'>"
+        "<a href='{{ ev.url }}' target='_blank' style='color:var(--brand);text-decoration:none'>"
+        "{% if assignees %}<b>{{ ev.title }}</b>{% else %}{{ ev.title }}{% endif %}</a>"
+        "{% if assignees %}{% for a in ev.assignees %}<span class='chip'>{{ a }}</span>{% endfor %}{% endif %}"
+        "</div></div>{% endfor %}{% endif %}{% endblock %}"
+    ),
+    "ministry": (
+        "<div class='mini-grid' style='margin-bottom:12px;'>{% for key, label in stats %}"
+        "<div class='mini-card'><div class='mini-label'>{{ label }}</div>"
+        "<div class='mini-value'>{{ values.get(key, 0) }}</div></div>{% endfor %}</div>"
+    ),
+    "map": (
+        "{% extends 'card' %}{% block body %}{% if text %}{% include 'note' %}{% endif %}"
+        "<img src='{{ src }}' alt='World map of YouTube viewers' "
+        "style='width:100%;height:auto;max-height:{{ height }}px;display:block'/>{% endblock %}"
+    ),
+    "kpi": (
+        "{% extends 'card' %}{% block body %}{% if text %}{% include 'note' %}{% endif %}"
+        "<div class='kpi-card youtube' style='min-width:200px;max-width:280px;text-align:left;'>"
+        "<div class='kpi-head'><i class='fa-brands fa-youtube icon' style='color:#ff3d3d'></i>"
+        "<span class='kpi-name'>YouTube</span></div>"
+        "<div class='kpi-label'>Subscribers</div><div class='kpi-value'>{{ subs }}</div>"
+        "<div class='kpi-label'>Total Views</div><div class='kpi-value'>{{ total }}</div>"
+        "</div>{% endblock %}"
+    ),
+    "views": (
+        "{% extends 'card' %}{% block body %}{% if text %}{% include 'note' %}{% endif %}"
+        "<div class='small'>ℹ️ YouTube Analytics can lag up to 48h. Latest day may be missing until processed.</div>"
+        "{% for label, pct, value in rows %}<div class='grid-views'><div>{{ label }}</div>"
+        "<div class='views-bar'><span style='width:{{ pct }}%'></span></div>"
+        "<div style='text-align:right'>{{ value }}</div></div>{% endfor %}{% endblock %}"
+    ),
+    # Live mode page skeleton: [data-slot] elements are filled from the component's slots
+    "live": (
+        "<div class='lv-head'><div style='display:flex;align-items:center;gap:10px;'>"
+        "<img class='lv-logo' src='data:image/png;base64,{{ logo }}' alt='LoudVoice logo'/>"
+        "<div class='title'>LOUDVOICE</div></div><div class='timestamp' data-slot='timestamp'></div></div>"
+        "<div class='section-header-wrapper'><div class='section' style='display:flex;align-items:center'>"
+        "Ministry Tracker{{ chip }}</div></div><div data-slot='ministry'></div>"
+        "<div class='lv-row' style='grid-template-columns:1.05fr 1fr 1.05fr 1.05fr'>"
+        "<div data-slot='card.tasks'></div><div data-slot='card.filming'></div><div data-slot='card.leave'></div>"
+        "<div><div data-slot='card.vol'></div><div data-slot='card.guest'></div></div></div>"
+        "<div class='lv-row' style='grid-template-columns:1.35fr .65fr'><div data-slot='card.map'></div>"
+        "<div><div data-slot='card.kpi'></div><div data-slot='card.views'></div></div></div>"
+    ),
+}
+MINISTRY_STATS = [("prayer", "Prayer"), ("studies", "Studies"), ("follow_ups", "Follow Ups"), ("baptisms", "Baptisms")]
+
+@st.cache_resource
+def card_templates() -> dict[str, jinja2.Template]:
+    env = jinja2.Environment(loader=jinja2.DictLoader(CARD_TEMPLATES), autoescape=True,
+                             undefined=jinja2.StrictUndefined)
+    env.filters["event_range"] = fmt_event_range
+    return {name: env.get_template(name) for name in CARD_TEMPLATES}
+
+def render_card(name: str, **ctx) -> str:
+    """One card's complete HTML from its template (style/chip/text default to empty)."""
+    return card_templates()[name].render({"style": "", "chip": "", "text": "", **ctx})
+
+def task_rows(tasks: list) -> list[dict]:
+    """ClickUp task dicts or mock (name, status) tuples -> the tasks template's rows."""
+    rows = []
+    for t in tasks:
+        if not isinstance(t, dict):
+            name, status = t[:2]
+            t = {"name": name, "status": status}
+        rows.append({
+            "name": t["name"], "status": t["status"], "due_str": t.get("due_str") or "",
+            "status_hex": t.get("status_hex") or "#ff5a5f", "who": t.get("who") or "",
+            "url": t.get("url") or "#", "overdue": t.get("overdue", False), "pct": task_pct(t["status"]),
+        })
+    return rows
+
+# ---- Live mode (?live=1): client-side dashboard fed JSON diffs ----
+# The browser loads assets/live_dashboard/index.html once; each rerun then sends only
+# the slots (card HTML, header chips, counters) that changed for this session.
+LIVE_KEY       = "lv_live"       # component key; its value is the browser's resync request
+LIVE_DIR       = Path(__file__).with_name("assets") / "live_dashboard"
+CHIP_SOURCES   = ("clickup_tasks", "sheets", "calendars", "yt_countries", "yt_kpi", "yt_daily")
+live_dashboard = components.declare_component("lv_live", path=str(LIVE_DIR))
+
+def chip_slot(source: str) -> Markup:
+    """Placeholder for card_chip(source); the chip itself is its own slot (its age changes every tick)."""
+    return Markup("<span data-slot='chip.{}' style='margin-left:auto'></span>").format(source)
+
+def live_message(slots: dict[str, str], full_sync) -> dict:
+    """
+    This rerun's message for the live component. On the session's first run, or when the
+    browser asks for a resync, every slot plus full_sync() (css, layout); otherwise only the
+    slots whose HTML changed since the last message ("base") and those that went away ("drop").
+    """
+    sent = st.session_state.setdefault("_lv_sent", {"seq": 0, "slots": {}, "resync": None})
+    ask = (st.session_state.get(LIVE_KEY) or {}).get("resync")
+    msg = {"seq": sent["seq"] + 1}
+    if not sent["seq"] or ask != sent["resync"]:
+        msg.update(full=True, set=slots, **full_sync())
+    else:
+        msg.update(base=sent["seq"], set={k: v for k, v in slots.items() if sent["slots"].get(k) != v},
+                   drop=[k for k in sent["slots"] if k not in slots])
+    sent.update(seq=msg["seq"], slots=slots, resync=ask)
+    return msg
+
 # =======================
 # Defaults / mocks (safe)
 # =======================
@@ -1452,6 +2943,39 @@ def _get_clickup_creds():
 
 tasks: list = []
 cu_token, cu_list = _get_clickup_creds()
+_, _, _, cu_vol_view, cu_leave_view, cu_guest_view = _get_clickup_ids()
+yt_api_key = st.secrets.get("YOUTUBE_API_KEY")
+channel_ids = st.secrets.get("YT_CHANNEL_IDS", [])  # list of UC IDs
+oauth_bundles = _get_oauth_bundles()
+MIN_DOC  = st.secrets["gs_ministry_id"]
+FILM_DOC = st.secrets["gs_filming_id"]
+
+# Optional ClickUp webhook receiver: with it up, polling drops to a slow safety net
+cu_hook_secret = st.secrets.get("CLICKUP_WEBHOOK_SECRET", "")
+cu_hook = None
+if cu_token and cu_hook_secret:
+    try:
+        cu_hook = clickup_webhook(int(st.secrets.get("CLICKUP_WEBHOOK_PORT", 8765)), cu_hook_secret, cu_token)
+        REFRESH_EVERY["clickup_tasks"] = REFRESH_EVERY["calendars"] = CLICKUP_WEBHOOK_POLL
+    except OSError as e:
+        st.warning(f"ClickUp webhook receiver not started ({e}); polling every {REFRESH_EVERY['calendars']}s.")
+
+# Register every source with the shared scheduler (idempotent across reruns/sessions)
+if cu_token and cu_list:
+    SCHED.register("clickup_tasks", clickup_tasks_upcoming, REFRESH_EVERY["clickup_tasks"],
+                   cu_token, cu_list, limit=12)
+cal_views = tuple(v for v in (cu_leave_view, cu_vol_view, cu_guest_view) if v)
+if cu_token and cal_views:
+    SCHED.register("calendars", clickup_calendar_views, REFRESH_EVERY["calendars"],
+                   cu_token, cal_views, tz_name=LOCAL_TZ_NAME)
+if yt_api_key and channel_ids:
+    SCHED.register("yt_kpi", yt_channels_aggregate, REFRESH_EVERY["yt_kpi"], yt_api_key, list(channel_ids))
+if oauth_bundles:
+    SCHED.register("yt_daily", aggregate_daily_from_oauth_bundles, REFRESH_EVERY["yt_daily"],
+                   oauth_bundles, days=14)
+    SCHED.register("yt_countries", aggregate_countries_from_oauth_bundles, REFRESH_EVERY["yt_countries"],
+                   oauth_bundles, days=DAYS_FOR_MAP)
+SCHED.register("sheets", load_sheet_cards, REFRESH_EVERY["sheets"], MIN_DOC, FILM_DOC, limit=6)
 
 if not cu_token or not cu_list:
     st.info("Missing secret(s): CLICKUP_TOKEN / CLICKUP_LIST_ID — using mock data for that section.")
@@ -1464,7 +2988,7 @@ if not cu_token or not cu_list:
 else:
     try:
         with st.spinner("Loading ClickUp tasks…"):
-            tasks_live, cu_err = clickup_tasks_upcoming(cu_token, cu_list, limit=12)
+            tasks_live, cu_err = SCHED.read("clickup_tasks")
         if cu_err:
             st.warning(cu_err)
             tasks = [
@@ -1484,11 +3008,11 @@ else:
 filming = MOCK["filming"]
 
 # KPI card via Data API (aggregate)
-yt_api_key = st.secrets.get("YOUTUBE_API_KEY")
-channel_ids = st.secrets.get("YT_CHANNEL_IDS", [])  # list of UC IDs
 try:
     if yt_api_key and channel_ids:
-        youtube = yt_channels_aggregate(yt_api_key, channel_ids)
+        youtube = SCHED.read("yt_kpi")
+        if youtube.get("missing"):
+            ERR["yt_kpi"] = f"No stats returned for channel(s): {', '.join(youtube['missing'])}"
 except Exception as e:
     ERR["yt_kpi"] = f"Channel Stats error: {e}"
     # keep existing youtube mock values
@@ -1496,12 +3020,13 @@ except Exception as e:
 # ---------- YouTube Analytics: 7-day + 28-day countries ----------
 yt_last7_vals, yt_last7_labels = [], []
 cdf = pd.DataFrame()
+yt_daily_status, yt_map_status = [], []
 
 try:
     if oauth_bundles:
         # 7-day
         try:
-            raw = aggregate_daily_from_oauth_bundles(oauth_bundles, days=14)
+            raw, yt_daily_status = SCHED.read("yt_daily")
             if not raw.empty:
                 last7_df = raw.tail(7)
                 yt_last7_vals   = last7_df["views"].tolist()
@@ -1516,7 +3041,7 @@ try:
 
         # Country aggregate
         try:
-            cdf = aggregate_countries_from_oauth_bundles(oauth_bundles, days=DAYS_FOR_MAP)
+            cdf, yt_map_status = SCHED.read("yt_countries")
             if cdf.empty:
                 raise RuntimeError("No rows from Analytics (countries).")
         except Exception as e:
@@ -1541,24 +3066,99 @@ except Exception as e:
         cdf = MOCK["yt_countries"].copy()
 
 # Build choro_df from whatever cdf we have (live or mock)
-choro_df = cdf.copy()
-choro_df = add_country_names(choro_df)
-choro_df["iso3"] = choro_df["country"].apply(country_to_iso3)
-choro_df = choro_df.dropna(subset=["iso3"])
+choro_df = choro_frame(cdf)
 
-MIN_DOC  = st.secrets["gs_ministry_id"]
-FILM_DOC = st.secrets["gs_filming_id"]
+# Ministry totals (read-only) + filming list (next 5 upcoming including today)
+try:
+    sheet_cards = SCHED.read("sheets")
+    ministry, filming = sheet_cards["ministry"], sheet_cards["filming"]
+    filming_debug = sheet_cards.get("filming_debug")
+except Exception as e:
+    st.warning(f"Google Sheets error: {e}")
+    ministry, filming, filming_debug = MOCK["ministry"], MOCK["filming"], None
+
+# ---- Cards (one HTML fragment each, shared by the Streamlit layout and live mode) ----
+cu_token, cu_list, cu_view, cu_vol_view, cu_leave_view, cu_guest_view = _get_clickup_ids()
+CHIP_STATUS = {"yt_countries": yt_map_status, "yt_daily": yt_daily_status}   # multi-channel cards
+
+def header_chip(source: str) -> str:
+    return card_chip(source, CHIP_STATUS.get(source))
+
+def calendar_card(title: str, view_id: str, secret: str, empty: str, chip: str, *, style: str = "",
+                  assignees: bool = True, out_today: bool = False) -> str:
+    """A ClickUp calendar view's card: next CALENDAR_LIMIT events, or the reason there are none."""
+    ctx = {"title": title, "chip": chip, "style": style, "assignees": assignees,
+           "events": [], "out_today": []}
+    if not cu_token or not view_id:
+        return render_card("calendar", **ctx, text=Markup("Add {} to <code>st.secrets</code>.").format(secret))
+    try:
+        table, err = SCHED.read("calendars")[view_id]
+    except Exception as e:
+        return render_card("calendar", **ctx, text=f"⚠️ {e}")
+    idx = EventIndex(table)
+    events = idx.upcoming(limit=CALENDAR_LIMIT)
+    if err:
+        return render_card("calendar", **ctx, text=f"⚠️ {err}")
+    if not events:
+        return render_card("calendar", **ctx, text=empty)
+    if out_today:
+        ctx["out_today"] = [", ".join(ev["assignees"]) or ev["title"] for ev in idx.on_date(datetime.now(LOCAL_TZ).date())]
+    return render_card("calendar", **{**ctx, "events": events})
+
+def page_cards(chip, svg_map: bool) -> dict[str, str]:
+    """Every card's HTML by slot name; chip(source) renders the header chips."""
+    warn = lambda key: f"⚠️ {ERR[key]}" if ERR[key] else ""
+    maxv = max(yt_last7_vals) if yt_last7_vals else 1
+    cards = {
+        "ministry":     render_card("ministry", stats=MINISTRY_STATS, values=ministry),
+        "card.tasks":   render_card("tasks", title="ClickUp Tasks (Upcoming)", chip=chip("clickup_tasks"),
+                                    tasks=task_rows(tasks)),
+        "card.filming": render_card("filming", title="Next Filming Timeslots", chip=chip("sheets"),
+                                    rows=filming, text="No upcoming timeslots found."),
+        "card.leave":   calendar_card("Leave Calendar", cu_leave_view, "CLICKUP_LEAVE_VIEW_ID", "No upcoming leave.",
+                                      chip("calendars"), assignees=False, out_today=True),
+        "card.vol":     calendar_card("Volunteer Calendar", cu_vol_view, "CLICKUP_VOL_VIEW_ID",
+                                      "No upcoming volunteer slots.", chip("calendars")),
+        "card.guest":   calendar_card("Guest Calendar", cu_guest_view, "CLICKUP_GUEST_VIEW_ID", "No upcoming guests.",
+                                      chip("calendars"), style="margin-top:-6px;"),
+        "card.kpi":     render_card("kpi", title="Channel Stats", chip=chip("yt_kpi"), text=warn("yt_kpi"),
+                                    subs=fmt_num(youtube["subs"]), total=fmt_num(youtube["total"])),
+        "card.views":   render_card("views", title="YouTube Views (Last 7 Days, complete data only)",
+                                    chip=chip("yt_daily"), style="margin-top:-6px;", text=warn("yt_last7"),
+                                    rows=[(d, int((v / maxv) * 100) if maxv else 0, fmt_num(int(v)))
+                                          for d, v in zip(yt_last7_labels, yt_last7_vals)]),
+    }
+    if svg_map:
+        cards["card.map"] = render_card("map", title=f"World Map — YouTube Viewers (last {DAYS_FOR_MAP} days)",
+                                        chip=chip("yt_countries"), text=warn("yt_map"),
+                                        src=cached_svg_map(choro_df), height=MAP_HEIGHT)
+    return cards
 
-# Ministry totals (read-only)
-ministry = load_ministry_totals(MIN_DOC, "Ministry")
+LOGO_PATH = "assets/loudvoice_logo.png"
+now = datetime.now(LOCAL_TZ).strftime('%B %d, %Y %I:%M %p')
 
-# Filming list (next 5 upcoming including today)
-filming = load_upcoming_filming(FILM_DOC, "Filming Integration", limit=6)
+# =======================
+# Live mode: one component, only changed slots per rerun (map drawn as SVG)
+# =======================
+if LIVE:
+    slots = page_cards(chip_slot, svg_map=True)
+    slots["timestamp"] = str(Markup.escape(now))
+    slots.update({f"chip.{source}": header_chip(source) for source in CHIP_SOURCES})
+    msg = live_message(slots, lambda: {"css": "".join(PAGE_STYLES),
+                                       "layout": render_card("live", logo=embed_img_b64(LOGO_PATH),
+                                                             chip=chip_slot("sheets"))})
+    live_dashboard(msg=msg, key=LIVE_KEY, default=None)
+    if DEBUG:
+        st.caption(f"Live: message {msg['seq']} ({'full' if msg.get('full') else 'diff'}), "
+                   f"{len(msg['set'])} slot(s), {len(json.dumps(msg)) / 1024:.1f} KiB")
+    st.stop()
+
+cards = page_cards(header_chip, svg_map=MAP_MODE == "svg")
 
 # =======================
 # Header
 # =======================
-LOGO_B64 = embed_img_b64("assets/loudvoice_logo.png")
+LOGO_B64 = embed_img_b64(LOGO_PATH)
 
 t1, t2 = st.columns([0.75, 0.25])
 with t1:
@@ -1572,7 +3172,6 @@ with t1:
         unsafe_allow_html=True
     )
 with t2:
-    now = datetime.now(LOCAL_TZ).strftime('%B %d, %Y %I:%M %p')
     st.markdown(f"<div class='timestamp'>{now}</div>", unsafe_allow_html=True)
 
 # =======================
@@ -1584,210 +3183,58 @@ with t2:
 
 # ---- Row 1: Ministry Tracker title ----
 st.markdown(
-    "<div class='section-header-wrapper'><div class='section'>Ministry Tracker</div></div>",
+    "<div class='section-header-wrapper'><div class='section' style='display:flex;align-items:center'>"
+    f"Ministry Tracker{card_chip('sheets')}</div></div>",
     unsafe_allow_html=True
 )
 
 # ---- Row 2: Prayer | Studies | Follow Ups | Baptisms ----
-st.markdown(
-    f"""
-    <div class="mini-grid" style="margin-bottom:12px;">
-      <div class="mini-card"><div class="mini-label">Prayer</div><div class="mini-value">{ministry['prayer']}</div></div>
-      <div class="mini-card"><div class="mini-label">Studies</div><div class="mini-value">{ministry['studies']}</div></div>
-      <div class="mini-card"><div class="mini-label">Follow Ups</div><div class="mini-value">{ministry.get('follow_ups', 0)}</div></div>
-      <div class="mini-card"><div class="mini-label">Baptisms</div><div class="mini-value">{ministry['baptisms']}</div></div>
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+st.markdown(cards["ministry"], unsafe_allow_html=True)
 
 # ---- Row 3: ClickUp Tasks | Next Filming | Leave Calendar | Volunteer Calendar ----
 r3c1, r3c2, r3c3, r3c4 = st.columns([1.05, 1.0, 1.05, 1.05])
 
 with r3c1:
-    st.markdown("<div class='card'><div class='section'>ClickUp Tasks (Upcoming)</div>", unsafe_allow_html=True)
-    for t in tasks:
-        if isinstance(t, dict):
-            name, status, due_str = t["name"], t["status"], t["due_str"]
-            status_hex = t.get("status_hex") or "#ff5a5f"
-            who        = t.get("who") or ""
-            url        = t.get("url") or "#"
-            overdue    = t.get("overdue", False)
-        else:
-            name, status, due_str = t
-            status_hex, who, url, overdue = "#ff5a5f", "", "#", False
-
-        small_bits = ["<span class='small'>", status]
-        if due_str: small_bits += [" · due ", due_str]
-        if overdue: small_bits += [" <b style='color:#ff6b6b'>(overdue)</b>"]
-        small_bits += ["</span>"]
-        small_line = "".join(small_bits)
-        who_chip = f"<span style='font-size:11px;background:rgba(255,255,255,.08);padding:2px 6px;border-radius:8px;margin-left:6px'>{who}</span>" if who else ""
-
-        st.markdown(
-            f"<div class='grid-tasks-2'>"
-            f"<div><a href='{url}' target='_blank' style='color:#eef3ff;text-decoration:none'><b>{name}</b></a>{who_chip}"
-            f"<div>{small_line}</div></div>"
-            f"<div class='hbar'><span style='width:{task_pct(status)}%; background:{status_hex}'></span></div>"
-            f"</div>",
-            unsafe_allow_html=True,
-        )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(cards["card.tasks"], unsafe_allow_html=True)
+    if DEBUG and cu_hook:
+        st.caption(f"ClickUp webhook: {cu_hook.summary()}")
 
 with r3c2:
-    st.markdown("<div class='card'><div class='section'>Next Filming Timeslots</div>", unsafe_allow_html=True)
-    if not filming:
-        st.markdown("<div class='small'>No upcoming timeslots found.</div>", unsafe_allow_html=True)
-    for daydate, time_str, label in filming:
-        st.markdown(
-            f"<div class='film-row'><div><b>{daydate}</b> — {time_str}</div>"
-            f"<div class='film-right'>{label}</div></div>",
-            unsafe_allow_html=True,
-        )
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(cards["card.filming"], unsafe_allow_html=True)
+    if DEBUG:
+        st.caption(f"Sheets: {sheets_cache().summary()}")
+        for note in (filming_debug or {}).get("notes", []):
+            st.info(note)
+        if (filming_debug or {}).get("sample") is not None:
+            st.write("[filming] sample parsed rows:", filming_debug["sample"])
 
 with r3c3:
-    st.markdown("<div class='card'><div class='section'>Leave Calendar</div>", unsafe_allow_html=True)
-    cu_token, cu_list, cu_view, cu_vol_view, cu_leave_view, cu_guest_view = _get_clickup_ids()
-    if not cu_token or not cu_leave_view:
-        st.markdown("<div class='small'>Add CLICKUP_LEAVE_VIEW_ID to <code>st.secrets</code>.</div>", unsafe_allow_html=True)
-    else:
-        leave_items, leave_err = clickup_calendar_events_from_view(
-            cu_token, cu_leave_view, limit=12, tz_name=LOCAL_TZ_NAME
-        )
-        if leave_err:
-            st.markdown(f"<div class='small'>⚠️ {leave_err}</div>", unsafe_allow_html=True)
-        elif not leave_items:
-            st.markdown("<div class='small'>No upcoming leave.</div>", unsafe_allow_html=True)
-        else:
-            def fmt_range(ev):
-                s, e = ev["start"], ev["end"]
-                return f"<b>{s.strftime('%a, %b %d')}</b>" + (
-                    f" — {s.strftime('%H:%M')}" if s.date() == e.date() and (s.hour or s.minute)
-                    else f" → {e.strftime('%a, %b %d')}"
-                )
-            for ev in leave_items:
-                left = fmt_range(ev)
-                right = f"<a href='{ev['url']}' target='_blank' style='color:var(--brand);text-decoration:none'>{ev['title']}</a>"
-                st.markdown(f"<div class='film-row'><div>{left}</div><div class='film-right'>{right}</div></div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(cards["card.leave"], unsafe_allow_html=True)
 
 with r3c4:
-    # --- Volunteer Calendar Card ---
-    st.markdown("<div class='card'><div class='section'>Volunteer Calendar</div>", unsafe_allow_html=True)
-    cu_token, _, _, cu_vol_view, _, cu_guest_view = _get_clickup_ids()
-
-    if not cu_token or not cu_vol_view:
-        st.markdown("<div class='small'>Add CLICKUP_VOL_VIEW_ID to <code>st.secrets</code>.</div>", unsafe_allow_html=True)
-    else:
-        vol_items, vol_err = clickup_calendar_events_from_view(
-            cu_token, cu_vol_view, limit=12, tz_name=LOCAL_TZ_NAME
-        )
-        if vol_err:
-            st.markdown(f"<div class='small'>⚠️ {vol_err}</div>", unsafe_allow_html=True)
-        elif not vol_items:
-            st.markdown("<div class='small'>No upcoming volunteer slots.</div>", unsafe_allow_html=True)
-        else:
-            def fmt_range(ev):
-                s, e = ev["start"], ev["end"]
-                return f"<b>{s.strftime('%a, %b %d')}</b>" + (
-                    f" — {s.strftime('%H:%M')}" if s.date() == e.date() and (s.hour or s.minute)
-                    else f" → {e.strftime('%a, %b %d')}"
-                )
-
-            for ev in vol_items:
-                left = fmt_range(ev)
-                chips_html = "".join(
-                    f"<span style='font-size:11px;background:rgba(255,255,255,.08);padding:2px 6px;border-radius:8px;margin-left:6px'>{a}</span>"
-                    for a in ev.get("assignees", [])
-                )
-                right = f"<a href='{ev['url']}' target='_blank' style='color:var(--brand);text-decoration:none'><b>{ev['title']}</b></a>{chips_html}"
-                st.markdown(
-                    f"<div class='film-row'><div>{left}</div><div class='film-right'>{right}</div></div>",
-                    unsafe_allow_html=True,
-                )
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    # --- Guest Calendar Card (stacked right below, tight spacing) ---
-    st.markdown("<div class='card' style='margin-top:-6px;'><div class='section'>Guest Calendar</div>", unsafe_allow_html=True)
-    if not cu_token or not cu_guest_view:
-        st.markdown("<div class='small'>Add CLICKUP_GUEST_VIEW_ID to <code>st.secrets</code>.</div>", unsafe_allow_html=True)
-    else:
-        guest_items, guest_err = clickup_calendar_events_from_view(
-            cu_token, cu_guest_view, limit=12, tz_name=LOCAL_TZ_NAME
-        )
-        if guest_err:
-            st.markdown(f"<div class='small'>⚠️ {guest_err}</div>", unsafe_allow_html=True)
-        elif not guest_items:
-            st.markdown("<div class='small'>No upcoming guests.</div>", unsafe_allow_html=True)
-        else:
-            def fmt_range(ev):
-                s, e = ev["start"], ev["end"]
-                return f"<b>{s.strftime('%a, %b %d')}</b>" + (
-                    f" — {s.strftime('%H:%M')}" if s.date() == e.date() and (s.hour or s.minute)
-                    else f" → {e.strftime('%a, %b %d')}"
-                )
-            for ev in guest_items:
-                left  = fmt_range(ev)
-                chips_html = "".join(
-                    f"<span style='font-size:11px;background:rgba(255,255,255,.08);padding:2px 6px;"
-                    f"border-radius:8px;margin-left:6px'>{a}</span>"
-                    for a in ev.get("assignees", [])
-                )
-                right = (
-                    f"<a href='{ev['url']}' target='_blank' "
-                    f"style='color:var(--brand);text-decoration:none'><b>{ev['title']}</b></a>{chips_html}"
-                )
-                st.markdown(
-                    f"<div class='film-row'><div>{left}</div><div class='film-right'>{right}</div></div>",
-                    unsafe_allow_html=True,
-                )
-    st.markdown("</div>", unsafe_allow_html=True)
+    # --- Volunteer Calendar, then Guest Calendar stacked right below (tight spacing) ---
+    st.markdown(cards["card.vol"] + cards["card.guest"], unsafe_allow_html=True)
 
 # ---- Row 5: World Map | Channel Stats ----
 r5_left, r5_right = st.columns([1.35, 0.65])
 
 with r5_left:
-    st.markdown("<div class='card'><div class='section'>World Map — YouTube Viewers (last {DAYS_FOR_MAP} days)</div>", unsafe_allow_html=True)
-    if ERR["yt_map"]:
-        st.warning(ERR["yt_map"])
-    fig = build_choropleth(choro_df, MAP_HEIGHT)
-    st.plotly_chart(fig, use_container_width=True, theme=None, config={"displayModeBar": False})
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with r5_right:
-    # ---- Channel Stats (card) ----
-    st.markdown("<div class='card'><div class='section'>Channel Stats</div>", unsafe_allow_html=True)
-    if ERR["yt_kpi"]:
-        st.warning(ERR["yt_kpi"])
-    st.markdown(f"""
-        <div class="kpi-card youtube" style="min-width:200px;max-width:280px;text-align:left;">
-          <div class="kpi-head">
-            <i class="fa-brands fa-youtube icon" style="color:#ff3d3d"></i>
-            <span class="kpi-name">YouTube</span>
-          </div>
-          <div class="kpi-label">Subscribers</div><div class="kpi-value">{fmt_num(youtube['subs'])}</div>
-          <div class="kpi-label">Total Views</div><div class="kpi-value">{fmt_num(youtube['total'])}</div>
-        </div>
-    """, unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)  # close Channel Stats card
-
-    # ---- YouTube Views (7-day) stacked right below ----
-    st.markdown("<div class='card' style='margin-top:-6px;'><div class='section'>YouTube Views (Last 7 Days, complete data only)</div>", unsafe_allow_html=True)
-    if ERR["yt_last7"]:
-        st.warning(ERR["yt_last7"])
-    st.markdown("<div class='small'>ℹ️ YouTube Analytics can lag up to 48h. Latest day may be missing until processed.</div>", unsafe_allow_html=True)
-
-    vals = yt_last7_vals[:]
-    maxv = max(vals) if vals else 1
-    for d, v in zip(yt_last7_labels, vals):
-        pct = int((v / maxv) * 100) if maxv else 0
+    if "card.map" in cards:
+        st.markdown(cards["card.map"], unsafe_allow_html=True)
+    else:
         st.markdown(
-            f"<div class='grid-views'>"
-            f"<div>{d}</div>"
-            f"<div class='views-bar'><span style='width:{pct}%'></span></div>"
-            f"<div style='text-align:right'>{fmt_num(int(v))}</div>"
-            f"</div>",
+            f"<div class='card'><div class='section'>World Map — YouTube Viewers (last {DAYS_FOR_MAP} days)"
+            f"{header_chip('yt_countries')}</div>",
             unsafe_allow_html=True,
         )
-    st.markdown("</div>", unsafe_allow_html=True)  # close YouTube Views card
+        if ERR["yt_map"]:
+            st.warning(ERR["yt_map"])
+        fig = cached_choropleth(choro_df, MAP_HEIGHT)
+        st.plotly_chart(fig, use_container_width=True, theme=None, config={"displayModeBar": False})
+        st.markdown("</div>", unsafe_allow_html=True)
+
+with r5_right:
+    # ---- Channel Stats, then YouTube Views (7-day) stacked right below ----
+    st.markdown(cards["card.kpi"] + cards["card.views"], unsafe_allow_html=True)
+    if DEBUG:
+        st.caption(f"Data API conditional requests: {etag_store().summary()}")